@@ -0,0 +1,22 @@
+class SerialOrFqidConverter:
+    """
+    Match an author serial (UUID) or an author FQID, either raw or
+    URL-encoded.
+
+    A serial may take any form uuid.UUID() accepts (hyphenated or 32 bare
+    hex digits, optionally braced or prefixed with urn:uuid:); the view
+    validates it. Unlike the catch-all `path` converter, this rejects
+    anything else during URL resolution, and a bare serial cannot run
+    into the following path segments.
+    """
+    regex = (
+        r'(?:(?:urn(?::|%3[aA]))?(?:uuid(?::|%3[aA]))?'
+        r'(?:\{|%7[bB])?[0-9a-fA-F-]{32,}(?:\}|%7[dD])?'
+        r'|https?(?::|%3[aA]).+)'
+    )
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return str(value)
@@ -0,0 +1,38 @@
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework import filters
+
+
+class AuthorSearchFilter(filters.SearchFilter):
+    """
+    Search authors by display name.
+
+    On PostgreSQL, authors match when their display name contains every
+    search term or is trigram-similar to the whole search, and results are
+    ranked by similarity. Each condition is served by a pg_trgm GIN index:
+    icontains compiles to UPPER(display_name::text) LIKE UPPER(...), which
+    uses the index on that expression, and the similarity match uses the
+    one on the bare column. Other databases fall back to the plain
+    icontains search of DRF's SearchFilter.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if (not search_terms or
+                connections[queryset.db].vendor != 'postgresql'):
+            return super().filter_queryset(request, queryset, view)
+
+        from django.contrib.postgres.lookups import TrigramSimilar
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        search = ' '.join(search_terms)
+        contains_all_terms = Q()
+        for term in search_terms:
+            contains_all_terms &= Q(display_name__icontains=term)
+
+        return queryset.filter(
+            contains_all_terms |
+            Q(TrigramSimilar(F('display_name'), search))
+        ).annotate(
+            similarity=TrigramSimilarity('display_name', search)
+        ).order_by('-similarity')
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from authors.services import sync_remote_authors
+from authors.utils import get_current_host
+
+
+class Command(BaseCommand):
+    help = (
+        'Fetches the author lists of all active remote nodes and stores '
+        'them as proxy authors. Suitable for running on a schedule.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--host',
+            type=str,
+            help=(
+                "This node's own host, e.g. 'https://node.example.com/'. "
+                "Authors on this host are not stored as proxies. Defaults "
+                "to settings.SITE_URL."))
+
+    def handle(self, *args, **options):
+        host = options['host'] or get_current_host()
+        if not host.endswith('/'):
+            host += '/'
+
+        sync_remote_authors(host)
+        self.stdout.write(
+            self.style.SUCCESS(f"Synced remote authors for host: {host}"))
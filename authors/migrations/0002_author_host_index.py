@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-16 08:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='author',
+            name='host',
+            field=models.URLField(db_index=True, help_text="URL of this author's node", max_length=500),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-16 09:00
+
+from django.db import migrations
+
+
+def create_trigram_index(apps, schema_editor):
+    """Create the pg_trgm extension and display_name index on PostgreSQL."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm;')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS authors_author_display_name_trgm '
+        'ON authors_author USING gin (display_name gin_trgm_ops);'
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP INDEX IF EXISTS authors_author_display_name_trgm;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authors', '0002_author_host_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
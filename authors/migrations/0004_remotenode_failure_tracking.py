@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authors', '0003_author_display_name_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='remotenode',
+            name='consecutive_failures',
+            field=models.PositiveIntegerField(default=0, help_text='Number of failed requests to this node since the last successful one.'),
+        ),
+        migrations.AddField(
+            model_name='remotenode',
+            name='last_failure_at',
+            field=models.DateTimeField(blank=True, help_text='When the most recent request to this node failed.', null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authors', '0004_remotenode_failure_tracking'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='follow',
+            index=models.Index(fields=['follower', 'following', 'status'], name='authors_fol_followe_b4ff8c_idx'),
+        ),
+    ]
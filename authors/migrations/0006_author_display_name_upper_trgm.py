@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-16 18:00
+
+from django.db import migrations
+
+
+def create_upper_trigram_index(apps, schema_editor):
+    """
+    Index UPPER(display_name) with gin_trgm_ops on PostgreSQL, matching the
+    expression Django compiles display_name__icontains to.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS authors_author_display_name_upper_trgm '
+        'ON authors_author USING gin '
+        '(UPPER(display_name::text) gin_trgm_ops);'
+    )
+
+
+def drop_upper_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP INDEX IF EXISTS authors_author_display_name_upper_trgm;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authors', '0005_follow_follower_following_status_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_upper_trigram_index, drop_upper_trigram_index),
+    ]
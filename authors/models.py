@@ -1,5 +1,8 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import (
+    Exists, F, Func, IntegerField, OuterRef, Q, Subquery
+)
 import uuid
 
 
@@ -62,6 +65,22 @@ class RemoteNode(models.Model):
         )
     )
 
+    # Health of outgoing requests, used to skip nodes that keep failing
+    consecutive_failures: models.PositiveIntegerField = (
+        models.PositiveIntegerField(
+            default=0,
+            help_text=(
+                "Number of failed requests to this node since the last "
+                "successful one."
+            )
+        )
+    )
+    last_failure_at: models.DateTimeField = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the most recent request to this node failed."
+    )
+
     def __str__(self):
         return self.host
 
@@ -84,6 +103,7 @@ class Author(AbstractUser):
     # Fields
     host: models.URLField = models.URLField(
         max_length=500,
+        db_index=True,
         help_text="URL of this author's node")
     display_name: models.CharField = models.CharField(
         max_length=150, blank=True)
@@ -100,10 +120,26 @@ class Author(AbstractUser):
             return request.build_absolute_uri(
                 f"/api/authors/{self.serial}/"
             )
+        # The request-less FQID is memoized per instance. The cache is keyed
+        # on (host, serial), so changing either recomputes it.
+        key = (self.host, self.serial)
+        cached = getattr(self, '_api_url_cache', None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        api_url = self.build_api_url(self.host, self.serial)
+        self._api_url_cache = (key, api_url)
+        return api_url
+
+    @staticmethod
+    def build_api_url(host, serial):
+        """
+        Return the request-less FQID of the author with `serial` on `host`,
+        for callers that only loaded those two columns.
+        """
         # Ensure host has a trailing slash
         # Remove any trailing 'api/' to avoid invalid URLs.
-        host = self.host.rstrip('api/').rstrip('/') + '/'
-        return f"{host}api/authors/{self.serial}/"
+        host = host.rstrip('api/').rstrip('/') + '/'
+        return f"{host}api/authors/{serial}/"
 
     def get_web_url(self, request=None):
         """
@@ -133,10 +169,12 @@ class Author(AbstractUser):
 
     def get_friends(self):
         """Get all authors who are mutual friends (both follow each other)"""
-        # Find authors where both follow relationships exist and are accepted
-        following_ids = self.get_following().values_list('serial', flat=True)
-        followers = self.get_followers()
-        return followers.filter(serial__in=following_ids)
+        # Followers that this author follows back, as one EXISTS subquery
+        return self.get_followers().filter(Exists(Follow.objects.filter(
+            follower=self,
+            following=OuterRef('url'),
+            status=Follow.Status.ACCEPTED,
+        )))
 
     def is_following(self, other_author):
         """Check if this author is following another author
@@ -150,8 +188,13 @@ class Author(AbstractUser):
     def is_friend_with(self, other_author):
         """Check if this author is friends with another author
         (mutual accepted follows)"""
-        return (self.is_following(other_author) and
-                other_author.is_following(self))
+        # Both directions in one query; (follower, following) is unique,
+        # so two matching rows means the follow is mutual.
+        return Follow.objects.filter(
+            Q(follower=self, following=other_author) |
+            Q(follower=other_author, following=self),
+            status=Follow.Status.ACCEPTED
+        ).count() == 2
 
     def send_follow_request(self, target_author):
         """Send a follow request to another author"""
@@ -236,6 +279,9 @@ class Follow(models.Model):
         indexes = [
             models.Index(fields=['follower', 'status']),
             models.Index(fields=['following', 'status']),
+            # Covers the "does A follow B (accepted)" check, so it can be
+            # answered from the index alone
+            models.Index(fields=['follower', 'following', 'status']),
         ]
 
     def __str__(self):
@@ -247,12 +293,12 @@ class Follow(models.Model):
     def approve(self):
         """Approve this follow request"""
         self.status = self.Status.ACCEPTED
-        self.save()
+        self.save(update_fields=['status', 'updated_at'])
 
     def reject(self):
         """Reject this follow request"""
         self.status = self.Status.REJECTED
-        self.save()
+        self.save(update_fields=['status', 'updated_at'])
 
     def is_pending(self):
         """Check if this follow request is pending"""
@@ -273,5 +319,45 @@ class Follow(models.Model):
             raise ValidationError("A user cannot follow themselves.")
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        # Saves that leave follower/following untouched cannot break the
+        # invariants above, so they skip full_clean() and its uniqueness
+        # query
+        update_fields = kwargs.get('update_fields')
+        if (update_fields is None or
+                {'follower', 'following'} & set(update_fields)):
+            self.full_clean()
         super().save(*args, **kwargs)
+
+
+def _count_subquery(queryset):
+    """Wrap a queryset as a correlated COUNT(*) subquery."""
+    return Subquery(
+        queryset.order_by().annotate(
+            count=Func(F('pk'), function='COUNT')
+        ).values('count'),
+        output_field=IntegerField(),
+    )
+
+
+def with_follow_counts(queryset):
+    """
+    Annotate an Author queryset with followers_count, following_count and
+    friends_count (accepted follows only), so serializing a list of
+    authors does not run three COUNT queries per author.
+    """
+    accepted = Follow.Status.ACCEPTED
+    followers = Follow.objects.filter(
+        following=OuterRef('url'), status=accepted)
+    following = Follow.objects.filter(
+        follower=OuterRef('url'), status=accepted)
+    # Followers that this author follows back
+    friends = followers.filter(Exists(Follow.objects.filter(
+        follower=OuterRef(OuterRef('url')),
+        following=OuterRef('follower'),
+        status=accepted,
+    )))
+    return queryset.annotate(
+        followers_count=_count_subquery(followers),
+        following_count=_count_subquery(following),
+        friends_count=_count_subquery(friends),
+    )
@@ -0,0 +1,29 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session():
+    """
+    Build the shared requests.Session used for all outgoing calls to
+    remote nodes. Connections are pooled per host so repeated calls to
+    the same node reuse keep-alive sockets instead of reconnecting.
+
+    Failed connections and reads are retried twice with a short backoff.
+    urllib3 only retries idempotent methods this way, so inbox POSTs are
+    never sent twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Module-level singleton. Credentials differ per node, so they are passed
+# with each request (auth=...) rather than stored on the session.
+SESSION = _build_session()
@@ -1,6 +1,9 @@
 from rest_framework import serializers
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import URLValidator
 from django.contrib.auth import get_user_model
 from .models import Follow
+from .utils import get_current_host
 from drf_spectacular.utils import extend_schema_field
 
 Author = get_user_model()
@@ -85,31 +88,64 @@ class AuthorSerializer(serializers.ModelSerializer):
 
         return obj.get_web_url(request=request)
 
+    def to_representation(self, instance):
+        """
+        Serialize an author, reusing the result if the same author was
+        already serialized during this request. Entry, comment and like
+        lists nest the same few authors on every row, and each
+        representation costs three follow-count lookups.
+        """
+        request = self.context.get('request')
+        if request is None or instance.pk is None:
+            return super().to_representation(instance)
+
+        payloads = getattr(request, '_author_payloads', None)
+        if payloads is None:
+            payloads = request._author_payloads = {}
+        payload = payloads.get(instance.pk)
+        if payload is None:
+            payload = payloads[instance.pk] = (
+                super().to_representation(instance))
+        # Copied so callers may modify their payload
+        return dict(payload)
+
     def _is_proxy_author(self, author, request):
         """Check if an author is a proxy (remote) author"""
         if not author.host:
             return False
 
-        current_host = f"{request.scheme}://{request.get_host()}/"
+        current_host = get_current_host(request)
         author_host = author.host.rstrip('/') + '/'
 
         # If hosts differ, this is a proxy author
         return author_host != current_host
 
+    # The count getters use the values annotated by with_follow_counts()
+    # when present and only fall back to a COUNT query otherwise.
+
     @extend_schema_field(serializers.IntegerField())
     def get_followers_count(self, obj):
         """Return the number of accepted followers"""
-        return obj.get_followers().count()
+        count = getattr(obj, 'followers_count', None)
+        if count is None:
+            count = obj.get_followers().count()
+        return count
 
     @extend_schema_field(serializers.IntegerField())
     def get_following_count(self, obj):
         """Return the number of accepted authors this user is following"""
-        return obj.get_following().count()
+        count = getattr(obj, 'following_count', None)
+        if count is None:
+            count = obj.get_following().count()
+        return count
 
     @extend_schema_field(serializers.IntegerField())
     def get_friends_count(self, obj):
         """Return the number of mutual friends"""
-        return obj.get_friends().count()
+        count = getattr(obj, 'friends_count', None)
+        if count is None:
+            count = obj.get_friends().count()
+        return count
 
 
 class FollowSerializer(serializers.ModelSerializer):
@@ -211,24 +247,56 @@ class AuthorsListSerializer(serializers.Serializer):
     )
 
 
-class RemoteAuthorValidationSerializer(serializers.Serializer):
+# Fields accepted from a remote author object, as (key, required, is_url).
+_REMOTE_AUTHOR_FIELDS = (
+    ('type', True, False),
+    ('id', True, True),
+    ('host', True, True),
+    ('displayName', True, False),
+    ('github', False, True),
+    ('profileImage', False, True),
+    ('description', False, False),
+)
+_validate_url = URLValidator()
+
+
+def validate_remote_author(data):
     """
-    A serializer to validate the format of author data received from a
-    remote server before creating a local proxy object. It does not save
-    anything to the database directly.
+    Validate the format of author data received from a remote server
+    before proxying it, and return only the known fields.
+
+    This runs on every remote profile fetch, so it checks the handful of
+    fields directly instead of building a DRF Serializer. Errors are still
+    raised as serializers.ValidationError with per-field messages.
     """
-    type = serializers.CharField(required=True)
-    id = serializers.URLField(required=True)
-    host = serializers.URLField(required=True)
-    displayName = serializers.CharField(required=True)
-    github = serializers.URLField(required=False, allow_blank=True)
-    profileImage = serializers.URLField(required=False, allow_blank=True)
-    description = serializers.CharField(required=False, allow_blank=True)
-
-    def create(self, validated_data):
-        raise NotImplementedError(
-            "This serializer is for validation only.")
-
-    def update(self, instance, validated_data):
-        raise NotImplementedError(
-            "This serializer is for validation only.")
+    if not isinstance(data, dict):
+        raise serializers.ValidationError(
+            {'non_field_errors': ['Expected an author object.']})
+
+    validated, errors = {}, {}
+    for key, required, is_url in _REMOTE_AUTHOR_FIELDS:
+        value = data.get(key)
+        if value is None:
+            if required:
+                errors[key] = ['This field is required.']
+            continue
+        if not isinstance(value, str):
+            errors[key] = ['Not a valid string.']
+            continue
+        if not value:
+            if required:
+                errors[key] = ['This field may not be blank.']
+            else:
+                validated[key] = value
+            continue
+        if is_url:
+            try:
+                _validate_url(value)
+            except DjangoValidationError:
+                errors[key] = ['Enter a valid URL.']
+                continue
+        validated[key] = value
+
+    if errors:
+        raise serializers.ValidationError(errors)
+    return validated
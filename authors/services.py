@@ -1,8 +1,118 @@
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
 import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.db.models import F
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from requests.auth import HTTPBasicAuth
 from urllib.parse import urlparse
 
-from .models import RemoteNode
+from .models import Author, RemoteNode
+from .net import SESSION
+from .utils import bulk_upsert_proxy_authors
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on concurrent requests when syncing authors from remote nodes
+REMOTE_FETCH_MAX_WORKERS = 16
+# (connect, read) timeouts in seconds for fetching a node's author list
+REMOTE_FETCH_TIMEOUT = (2, 3)
+# A node that failed this many syncs in a row is skipped until
+# NODE_FAILURE_COOLDOWN has passed since its last failure
+NODE_FAILURE_THRESHOLD = 3
+NODE_FAILURE_COOLDOWN = timedelta(minutes=5)
+# How long an active RemoteNode looked up by host is served from cache
+REMOTE_NODE_CACHE_SECONDS = 300
+# How long an inbox owner looked up by serial is served from cache
+INBOX_OWNER_CACHE_SECONDS = 60
+# The inbox owner's columns the inbox handlers read, and all that is cached
+INBOX_OWNER_FIELDS = ('id', 'url', 'serial', 'host')
+# Upper bound on concurrent inbox POSTs when fanning out an activity
+FANOUT_MAX_WORKERS = 16
+
+
+def _remote_node_cache_key(host):
+    return 'remote_node:' + hashlib.sha256(host.encode()).hexdigest()
+
+
+def get_active_remote_node(host):
+    """
+    Return the active RemoteNode registered for `host` (with a trailing
+    slash), or None. Every outgoing inbox POST needs the node's
+    credentials, so the lookup is cached, including misses; saving or
+    deleting a RemoteNode clears its entry.
+    """
+    key = _remote_node_cache_key(host)
+    node = cache.get(key)
+    if node is None:
+        # False marks a cached miss, since None means "not cached"
+        node = RemoteNode.objects.filter(
+            host=host, is_active=True).first() or False
+        cache.set(key, node, timeout=REMOTE_NODE_CACHE_SECONDS)
+    return node or None
+
+
+@receiver(post_save, sender=RemoteNode)
+@receiver(post_delete, sender=RemoteNode)
+def _invalidate_remote_node_cache(sender, instance, **kwargs):
+    cache.delete(_remote_node_cache_key(instance.host))
+
+
+def _inbox_owner_cache_key(serial):
+    return f'inbox_owner:{str(serial).lower()}'
+
+
+def get_inbox_owner(serial):
+    """
+    Return the Author whose inbox is at `serial`, or raise Http404. Every
+    inbox delivery starts with this lookup, so found authors are cached;
+    saving or deleting an Author clears its entry. Misses are not cached,
+    because proxy authors are created with bulk_create(), which sends no
+    signals.
+
+    Only the columns in INBOX_OWNER_FIELDS are cached (never the password
+    hash); the returned Author loads any other field on first access.
+    """
+    key = _inbox_owner_cache_key(serial)
+    row = cache.get(key)
+    if row is None:
+        owner = get_object_or_404(
+            Author.objects.only(*INBOX_OWNER_FIELDS), serial=serial)
+        row = {name: getattr(owner, name) for name in INBOX_OWNER_FIELDS}
+        cache.set(key, row, timeout=INBOX_OWNER_CACHE_SECONDS)
+        return owner
+    # from_db() expects the loaded values in model field order
+    field_names = [
+        field.attname for field in Author._meta.concrete_fields
+        if field.attname in row
+    ]
+    return Author.from_db(
+        Author.objects.db, field_names,
+        [row[name] for name in field_names])
+
+
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def _invalidate_inbox_owner_cache(sender, instance, **kwargs):
+    cache.delete(_inbox_owner_cache_key(instance.serial))
+
+
+def clear_cached_inbox_owners(serials):
+    """
+    Clear the cached inbox owner lookups of the authors with `serials`,
+    for writes that bypass the post_save signal (e.g. bulk_update()).
+    """
+    cache.delete_many([_inbox_owner_cache_key(serial) for serial in serials])
 
 
 class NodeService:
@@ -23,29 +133,215 @@ class NodeService:
             A requests.Response object on success,
             or raises an exception on failure.
         """
-        parsed_url = urlparse(recipient_author_url)
-        remote_host = f"{parsed_url.scheme}://{parsed_url.netloc}/"
-        inbox_url = f"{recipient_author_url.rstrip('/')}/inbox/"
-
-        try:
-            node = RemoteNode.objects.get(host=remote_host, is_active=True)
-        except RemoteNode.DoesNotExist:
+        node = get_active_remote_node(_node_host(recipient_author_url))
+        if node is None:
             # If we don't know the node, or it's disabled, we can't send.
             return
+        return _post_to_inbox(recipient_author_url, node, _encode(data))
+
+    def send_to_inboxes(self, recipient_author_urls, data: dict):
+        """
+        Sends a payload to the inboxes of several remote authors at once.
+
+        Recipients on unknown or disabled nodes are skipped. The POSTs run
+        concurrently, and a failed one is logged without affecting the
+        others.
+        """
+        # Nodes are resolved here, since the worker threads must not touch
+        # the database
+        deliveries = []
+        for url in recipient_author_urls:
+            node = get_active_remote_node(_node_host(url))
+            if node is not None:
+                deliveries.append((url, node))
+        if not deliveries:
+            return
+
+        # Every recipient gets the same body, so it is encoded only once
+        body = _encode(data)
 
+        def deliver(delivery):
+            url, node = delivery
+            try:
+                _post_to_inbox(url, node, body)
+            except requests.exceptions.RequestException:
+                logger.warning(
+                    "Failed to send %s to %s", data.get('type'), url)
+
+        max_workers = min(FANOUT_MAX_WORKERS, len(deliveries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(deliver, deliveries))
+
+
+def fan_out(recipient_author_urls, data):
+    """
+    Deliver `data` to the inboxes of `recipient_author_urls`. With
+    FANOUT_IN_BACKGROUND, delivery starts on a daemon thread once the
+    current transaction commits, so neither the saving request nor its
+    transaction waits on remote nodes; otherwise it runs inline.
+
+    Background deliveries are not queued or persisted: a daemon thread
+    dies with its process, so deliveries still in flight at shutdown are
+    lost.
+    """
+    recipient_author_urls = list(recipient_author_urls)
+    if not recipient_author_urls:
+        return
+    if not settings.FANOUT_IN_BACKGROUND:
+        NodeService().send_to_inboxes(recipient_author_urls, data)
+        return
+    transaction.on_commit(lambda: threading.Thread(
+        target=send_to_inboxes_in_thread,
+        args=(recipient_author_urls, data),
+        daemon=True,
+    ).start())
+
+
+def send_to_inboxes_in_thread(recipient_author_urls, data):
+    """
+    Thread target for a background NodeService.send_to_inboxes(). Errors
+    are logged instead of being lost with the thread, and the thread's own
+    database connection is closed when it finishes.
+    """
+    try:
+        NodeService().send_to_inboxes(recipient_author_urls, data)
+    except Exception:
+        logger.exception("Background fan-out of a %s failed.",
+                         data.get('type'))
+    finally:
+        connection.close()
+
+
+def _node_host(author_url):
+    """Return the scheme://netloc/ of the node hosting `author_url`."""
+    parsed_url = urlparse(author_url)
+    return f"{parsed_url.scheme}://{parsed_url.netloc}/"
+
+
+def _encode(data):
+    """Encode an inbox payload as requests' json= argument would."""
+    return json.dumps(data, allow_nan=False).encode('utf-8')
+
+
+def _post_to_inbox(author_url, node, body):
+    """
+    POST the JSON `body` (bytes) to the inbox of the author at
+    `author_url`, on `node`. Returns the response, or raises a
+    RequestException on failure.
+    """
+    response = SESSION.post(
+        f"{author_url.rstrip('/')}/inbox/",
+        data=body,
+        auth=HTTPBasicAuth(node.outgoing_username, node.outgoing_password),
+        headers={'Content-Type': 'application/json'},
+        timeout=5  # 5-second timeout for the request
+    )
+    # Raise an exception for bad status codes (4xx or 5xx)
+    response.raise_for_status()
+    return response
+
+
+def fetch_node_authors(node):
+    """
+    Fetch the author list from a single remote node.
+    Returns the list of author dicts, or None if the request failed.
+    Runs on a worker thread, so it must not touch the database.
+    """
+    try:
         auth = HTTPBasicAuth(node.outgoing_username, node.outgoing_password)
+        response = SESSION.get(
+            f"{node.host}/api/authors/",
+            auth=auth,
+            headers={'Accept': 'application/json'},
+            timeout=REMOTE_FETCH_TIMEOUT
+        )
+        response.raise_for_status()
+        return response.json().get('authors', [])
+    except requests.exceptions.RequestException:
+        logger.warning(
+            "RequestException while fetching remote authors: %s", node.host)
+    except Exception as e:
+        logger.warning(
+            "Exception while fetching remote authors: %s. %s", node.host, e)
+    return None
 
+
+def sync_remote_authors(current_host):
+    """
+    Fetch the author lists of all active remote nodes concurrently and
+    populate our database with proxy objects for remote authors.
+    The HTTP calls run in parallel so the wait is bounded by the slowest
+    node; the proxy writes stay on the calling thread.
+
+    Nodes that failed NODE_FAILURE_THRESHOLD times in a row are skipped
+    until NODE_FAILURE_COOLDOWN has passed, so dead peers do not cost a
+    timeout on every sync. A successful fetch resets the count.
+
+    Args:
+        current_host: This node's host with a trailing slash. Authors on
+                      this host are never stored as proxies.
+    """
+    now = timezone.now()
+    remote_nodes = list(RemoteNode.objects.filter(is_active=True).exclude(
+        consecutive_failures__gte=NODE_FAILURE_THRESHOLD,
+        last_failure_at__gt=now - NODE_FAILURE_COOLDOWN,
+    ))
+    logger.debug("Fetching remote authors from %d nodes.", len(remote_nodes))
+    if not remote_nodes:
+        return
+
+    max_workers = min(REMOTE_FETCH_MAX_WORKERS, len(remote_nodes))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(fetch_node_authors, remote_nodes))
+
+    _record_node_health(remote_nodes, results)
+
+    for node, authors_data in zip(remote_nodes, results):
+        if not authors_data:
+            continue
+        # Create new proxies and refresh existing ones in bulk. Each node
+        # is its own batch so one bad response cannot block the others.
         try:
-            response = requests.post(
-                inbox_url,
-                json=data,
-                auth=auth,
-                headers={'Content-Type': 'application/json'},
-                timeout=5  # 5-second timeout for the request
-            )
-            # Raise an exception for bad status codes (4xx or 5xx)
-            response.raise_for_status()
-            return response
-        except requests.exceptions.RequestException:
-            # Handle connection errors, timeouts, etc.
-            raise
+            count = bulk_upsert_proxy_authors(
+                authors_data, current_host=current_host)
+            logger.debug(
+                "Upserted %d proxy authors from %s.", count, node.host)
+        except Exception as e:
+            logger.warning(
+                "Exception while upserting proxy authors from %s: %s",
+                node.host, e)
+
+
+def _record_node_health(nodes, results):
+    """
+    Update each node's failure count after a sync, where a None result
+    means the fetch failed. Written with at most two UPDATE queries.
+    """
+    failed = [
+        node.pk for node, result in zip(nodes, results) if result is None]
+    recovered = [
+        node.pk for node, result in zip(nodes, results)
+        if result is not None and node.consecutive_failures]
+
+    if failed:
+        RemoteNode.objects.filter(pk__in=failed).update(
+            consecutive_failures=F('consecutive_failures') + 1,
+            last_failure_at=timezone.now(),
+        )
+    if recovered:
+        RemoteNode.objects.filter(pk__in=recovered).update(
+            consecutive_failures=0)
+
+
+def sync_remote_authors_in_thread(current_host):
+    """
+    Thread target for a background sync_remote_authors(). Errors are
+    logged instead of being lost with the thread, and the thread's own
+    database connection is closed when it finishes.
+    """
+    try:
+        sync_remote_authors(current_host)
+    except Exception:
+        logger.exception("Background remote author sync failed.")
+    finally:
+        connection.close()
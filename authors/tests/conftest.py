@@ -0,0 +1,49 @@
+import pytest
+from .factories import AuthorFactory
+
+
+def _class_scoped_author(django_db_blocker):
+    """
+    Create an author once for a whole test class.
+
+    The row is written outside the per-test transaction, so it survives
+    between tests in the class and is deleted explicitly at teardown.
+    Tests that modify the author should use a function-scoped author.
+    """
+    with django_db_blocker.unblock():
+        author = AuthorFactory()
+    yield author
+    with django_db_blocker.unblock():
+        author.delete()
+
+
+@pytest.fixture(scope='class')
+def author_a(django_db_setup, django_db_blocker):
+    """Create a test author shared by every test in the class"""
+    yield from _class_scoped_author(django_db_blocker)
+
+
+@pytest.fixture(scope='class')
+def author_b(django_db_setup, django_db_blocker):
+    """Create another test author shared by every test in the class"""
+    yield from _class_scoped_author(django_db_blocker)
+
+
+@pytest.fixture(scope='class')
+def author_c(django_db_setup, django_db_blocker):
+    """Create a third test author shared by every test in the class"""
+    yield from _class_scoped_author(django_db_blocker)
+
+
+@pytest.fixture(autouse=True)
+def _default_auth(request):
+    """
+    Authenticate the module's api_client as the author fixture named by
+    the test class's `default_auth` attribute, if it sets one. A test
+    that needs a different user calls force_authenticate itself.
+    """
+    user_fixture = getattr(request.cls, 'default_auth', None)
+    if user_fixture:
+        api_client = request.getfixturevalue('api_client')
+        api_client.force_authenticate(
+            user=request.getfixturevalue(user_fixture))
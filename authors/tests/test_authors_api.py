@@ -3,7 +3,16 @@ from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
 import urllib.parse
-from .factories import AuthorFactory
+import uuid
+from unittest.mock import patch
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+from authors.views import AuthorListView, REMOTE_AUTHORS_SYNC_CACHE_KEY
+from authors.services import (
+    NODE_FAILURE_THRESHOLD, get_inbox_owner, sync_remote_authors
+)
+from .factories import AuthorFactory, RemoteNodeFactory
 
 Author = get_user_model()
 
@@ -57,6 +66,106 @@ class TestAuthorsListAPI:
         assert 'displayName' in author_data
         assert author_data['type'] == 'author'
 
+    def test_remote_author_sync_is_throttled(self, api_client):
+        """Only the first listing within the sync interval hits remote nodes"""
+        cache.delete(REMOTE_AUTHORS_SYNC_CACHE_KEY)
+        with patch.object(
+                AuthorListView, '_fetch_remote_authors') as mock_fetch:
+            api_client.get('/api/authors/')
+            api_client.get('/api/authors/')
+            api_client.get('/api/authors/?page=2')
+        cache.delete(REMOTE_AUTHORS_SYNC_CACHE_KEY)
+
+        assert mock_fetch.call_count == 1
+
+    def test_search_does_not_sync_remote_authors(self, api_client):
+        """Searching the author list never triggers a remote sync"""
+        cache.delete(REMOTE_AUTHORS_SYNC_CACHE_KEY)
+        with patch.object(
+                AuthorListView, '_fetch_remote_authors') as mock_fetch:
+            response = api_client.get('/api/authors/?search=alice')
+        cache.delete(REMOTE_AUTHORS_SYNC_CACHE_KEY)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_fetch.assert_not_called()
+
+    def test_remote_author_sync_runs_in_background(self, api_client):
+        """The listing does not wait for the remote author sync"""
+        cache.delete(REMOTE_AUTHORS_SYNC_CACHE_KEY)
+        with override_settings(REMOTE_AUTHORS_SYNC_IN_BACKGROUND=True), \
+                patch('authors.views.threading.Thread') as mock_thread:
+            response = api_client.get('/api/authors/')
+        cache.delete(REMOTE_AUTHORS_SYNC_CACHE_KEY)
+
+        assert response.status_code == status.HTTP_200_OK
+        mock_thread.return_value.start.assert_called_once_with()
+
+    def test_remote_author_sync_skips_failing_nodes(self):
+        """Nodes that keep failing are skipped until the cooldown ends"""
+        healthy = RemoteNodeFactory()
+        RemoteNodeFactory(
+            consecutive_failures=NODE_FAILURE_THRESHOLD,
+            last_failure_at=timezone.now())
+
+        with patch('authors.services.fetch_node_authors',
+                   return_value=None) as mock_fetch:
+            sync_remote_authors('http://testserver/')
+
+        mock_fetch.assert_called_once_with(healthy)
+        healthy.refresh_from_db(fields=['consecutive_failures'])
+        assert healthy.consecutive_failures == 1
+
+    def test_remote_author_sync_updates_proxy_with_variant_url(self):
+        """A proxy stored under another form of the URL is updated in place"""
+        node = RemoteNodeFactory()
+        serial = uuid.uuid4()
+        # Stored without the trailing slash the node now sends
+        proxy = AuthorFactory(
+            serial=serial, host=node.host,
+            url=f'{node.host}api/authors/{serial}',
+            display_name='Old name', is_active=False)
+        authors_data = [
+            {
+                'type': 'author',
+                'id': f'{node.host}api/authors/{serial}/',
+                'host': node.host,
+                'displayName': 'New name',
+            },
+            {
+                'type': 'author',
+                'id': f'{node.host}api/authors/{uuid.uuid4()}/',
+                'host': node.host,
+                'displayName': 'Someone new',
+            },
+        ]
+
+        with patch('authors.services.fetch_node_authors',
+                   return_value=authors_data):
+            sync_remote_authors('http://testserver/')
+
+        proxy.refresh_from_db()
+        assert proxy.display_name == 'New name'
+        assert Author.objects.filter(serial=serial).count() == 1
+        assert Author.objects.filter(display_name='Someone new').exists()
+
+    def test_remote_author_sync_clears_cached_inbox_owner(self):
+        """A proxy's host changed by the sync is not served from cache"""
+        node = RemoteNodeFactory(host='http://remote.example/')
+        serial = uuid.uuid4()
+        proxy = AuthorFactory(
+            serial=serial, host='http://old.example/',
+            url=f'{node.host}api/authors/{serial}/', is_active=False)
+        assert get_inbox_owner(proxy.serial).host == 'http://old.example/'
+
+        with patch('authors.services.fetch_node_authors', return_value=[{
+                'type': 'author',
+                'id': proxy.url,
+                'host': node.host,
+                'displayName': proxy.display_name}]):
+            sync_remote_authors('http://testserver/')
+
+        assert get_inbox_owner(proxy.serial).host == node.host
+
 
 @pytest.mark.django_db
 class TestSingleAuthorAPI:
@@ -72,6 +181,15 @@ class TestSingleAuthorAPI:
         assert response.data['displayName'] == author.display_name
         assert response.data['id'].endswith(f'/api/authors/{author.serial}/')
 
+    def test_get_author_by_unhyphenated_serial(self, api_client, author):
+        """Serials resolve in any form uuid.UUID() accepts"""
+        for serial in (author.serial.hex, f'{{{author.serial}}}',
+                       f'urn:uuid:{author.serial}'):
+            response = api_client.get(f'/api/authors/{serial}/')
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data['displayName'] == author.display_name
+
     def test_get_author_by_fqid(self, api_client, author):
         """Test getting author by FQID (URL-encoded)"""
         # For a local FQID test, the author's host must match the
@@ -95,6 +213,39 @@ class TestSingleAuthorAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['id'] == fqid
 
+    def test_get_remote_author_uses_node_credentials(self, api_client):
+        """Remote profiles are fetched with the node's Basic auth"""
+        node = RemoteNodeFactory(host='http://remote.example/')
+        fqid = f'{node.host}api/authors/{uuid.uuid4()}/'
+        encoded_fqid = urllib.parse.quote(fqid, safe='')
+
+        with patch('authors.views.SESSION.get') as mock_get:
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.headers = {}
+            mock_get.return_value.json.return_value = {
+                'type': 'author',
+                'id': fqid,
+                'host': node.host,
+                'displayName': 'Remote Author',
+            }
+            response = api_client.get(f'/api/authors/{encoded_fqid}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        auth = mock_get.call_args.kwargs['auth']
+        assert auth.username == node.outgoing_username
+        assert auth.password == node.outgoing_password
+
+    def test_get_author_by_fqid_with_unhyphenated_serial(
+            self, api_client, author):
+        """FQIDs may carry the serial in any form uuid.UUID() accepts"""
+        fqid = f'http://testserver/api/authors/{author.serial.hex}/'
+        encoded_fqid = urllib.parse.quote(fqid, safe='')
+
+        response = api_client.get(f'/api/authors/{encoded_fqid}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['displayName'] == author.display_name
+
     def test_update_own_author_profile(self, api_client, author):
         """Test updating own author profile (authenticated)"""
         api_client.force_authenticate(user=author)
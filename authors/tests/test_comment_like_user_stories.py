@@ -1,7 +1,11 @@
+import json
 import pytest
+from unittest.mock import patch
+from django.test import override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
 from .factories import AuthorFactory, FollowFactory
+from authors.services import fan_out
 from entries.tests.factories import EntryFactory
 from entries.models import Comment, Like
 from django.contrib.contenttypes.models import ContentType
@@ -395,8 +399,8 @@ class TestLikeFanOutMultiNode:
         # Create a public entry
         entry = EntryFactory(author=entry_author, visibility='PUBLIC')
 
-        # Mock the requests.post to track outgoing like notifications
-        with patch('authors.views.requests.post') as mock_post:
+        # Mock the shared session to track outgoing like notifications
+        with patch('authors.net.SESSION.post') as mock_post:
             mock_post.return_value.raise_for_status = lambda: None
 
             # Simulate liker creating a like (this should trigger fan-out)
@@ -423,7 +427,7 @@ class TestLikeFanOutMultiNode:
                     f"Like not sent to {expected_url}"
 
             # Verify the like payload structure
-            like_payload = mock_post.call_args_list[0][1]['json']
+            like_payload = json.loads(mock_post.call_args_list[0][1]['data'])
             assert like_payload['type'] == 'like'
             assert like_payload['object'] == entry.url
             assert like_payload['author']['id'] == liker.get_api_url()
@@ -486,8 +490,8 @@ class TestLikeFanOutMultiNode:
         # Create a friends-only entry
         entry = EntryFactory(author=entry_author, visibility='FRIENDS')
 
-        # Mock the requests.post to track outgoing like notifications
-        with patch('authors.views.requests.post') as mock_post:
+        # Mock the shared session to track outgoing like notifications
+        with patch('authors.net.SESSION.post') as mock_post:
             mock_post.return_value.raise_for_status = lambda: None
 
             # Simulate liker creating a like (this should trigger fan-out)
@@ -509,6 +513,23 @@ class TestLikeFanOutMultiNode:
             assert call_url == expected_url
 
             # Verify the like payload
-            like_payload = mock_post.call_args_list[0][1]['json']
+            like_payload = json.loads(mock_post.call_args_list[0][1]['data'])
             assert like_payload['type'] == 'like'
             assert like_payload['object'] == entry.url
+
+
+class TestFanOut:
+    """Tests for authors.services.fan_out"""
+
+    def test_fan_out_waits_for_commit_in_background(
+            self, django_capture_on_commit_callbacks):
+        """Background fan-out starts only once the save has committed"""
+        with override_settings(FANOUT_IN_BACKGROUND=True), \
+                patch('authors.services.threading.Thread') as mock_thread:
+            with django_capture_on_commit_callbacks() as callbacks:
+                fan_out(['http://node-b.com/api/authors/1/'], {'type': 'like'})
+                mock_thread.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        mock_thread.return_value.start.assert_called_once_with()
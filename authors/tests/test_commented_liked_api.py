@@ -404,6 +404,24 @@ class TestAuthorLikedAPI:
         assert response.data['size'] == 5
         assert len(response.data['src']) == 5
 
+    def test_get_author_liked_count_refreshes_after_new_like(
+            self, api_client, author_a, author_b):
+        """A new like is counted even though page totals are cached"""
+        first, second = EntryFactory.create_batch(
+            2, author=author_b, visibility='PUBLIC')
+
+        api_client.force_authenticate(user=author_a)
+        inbox_url = f'/api/authors/{author_b.serial}/inbox/'
+        url = f'/api/authors/{author_a.serial}/liked/?page=1&size=5'
+
+        api_client.post(inbox_url, {
+            'type': 'like', 'object': first.get_api_url()}, format='json')
+        assert api_client.get(url).data['count'] == 1
+
+        api_client.post(inbox_url, {
+            'type': 'like', 'object': second.get_api_url()}, format='json')
+        assert api_client.get(url).data['count'] == 2
+
     def test_get_single_like_by_author_and_serial(
             self, api_client, author_a, author_b):
         """Test GET /api/authors/{AUTHOR_SERIAL}/liked/{LIKE_SERIAL}"""
@@ -1,9 +1,15 @@
 import pytest
 import urllib.parse
-from rest_framework.test import APIClient
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import (
+    APIClient, APIRequestFactory, force_authenticate
+)
 from rest_framework import status
-from .factories import AuthorFactory, FollowFactory
+from .factories import AuthorFactory, FollowFactory, RemoteNodeFactory
 from authors.models import Follow
+from authors.services import INBOX_OWNER_FIELDS, get_inbox_owner
+from authors.views import FollowerDetailView, InboxView
 
 pytestmark = pytest.mark.django_db
 
@@ -15,21 +21,25 @@ def api_client():
 
 
 @pytest.fixture
-def author_a():
-    """Create a test author"""
-    return AuthorFactory()
-
-
-@pytest.fixture
-def author_b():
-    """Create another test author"""
-    return AuthorFactory()
-
-
-@pytest.fixture
-def author_c():
-    """Create a third test author"""
-    return AuthorFactory()
+def call_follower_detail():
+    """
+    Call FollowerDetailView directly, skipping middleware, URL resolution
+    and response rendering. Only the status code and data are checked.
+    """
+    factory = APIRequestFactory()
+    view = FollowerDetailView.as_view()
+
+    def call(method, author, foreign_author, user=None):
+        url = (f'/api/authors/{author.serial}/followers/'
+               f'{foreign_author.serial}/')
+        request = getattr(factory, method)(url)
+        if user is not None:
+            force_authenticate(request, user=user)
+        return view(
+            request,
+            serial=author.serial,
+            foreign_author_fqid=str(foreign_author.serial))
+    return call
 
 
 class TestFollowersListAPI:
@@ -47,12 +57,16 @@ class TestFollowersListAPI:
     def test_get_followers_list_with_data(self, api_client, author_a):
         """Test getting followers list with accepted followers"""
         # Create some followers
-        follower1 = AuthorFactory()
-        follower2 = AuthorFactory()
+        follower1, follower2 = AuthorFactory.create_batch(2)
 
-        # Create accepted follow relationships
-        FollowFactory.create_accepted(follower=follower1, following=author_a)
-        FollowFactory.create_accepted(follower=follower2, following=author_a)
+        # Create accepted follow relationships in a single INSERT
+        Follow.objects.bulk_create([
+            Follow(
+                follower=follower,
+                following=author_a,
+                status=Follow.Status.ACCEPTED)
+            for follower in (follower1, follower2)
+        ])
 
         # Create a pending follow (should not appear)
         FollowFactory(
@@ -74,6 +88,25 @@ class TestFollowersListAPI:
         assert any(id.endswith(
             f'/api/authors/{follower2.serial}/') for id in follower_ids)
 
+    def test_get_followers_list_paginated(self, api_client, author_a):
+        """Test that ?page/?size return one page of followers"""
+        followers = AuthorFactory.create_batch(3)
+        Follow.objects.bulk_create([
+            Follow(
+                follower=follower,
+                following=author_a,
+                status=Follow.Status.ACCEPTED)
+            for follower in followers
+        ])
+
+        url = f'/api/authors/{author_a.serial}/followers/'
+        first_page = api_client.get(url, {'page': 1, 'size': 2})
+        second_page = api_client.get(url, {'page': 2, 'size': 2})
+
+        assert first_page.status_code == status.HTTP_200_OK
+        assert len(first_page.data['followers']) == 2
+        assert len(second_page.data['followers']) == 1
+
     def test_get_followers_by_fqid(self, api_client, author_a):
         """Test getting followers using FQID instead of serial"""
         follower = AuthorFactory()
@@ -92,43 +125,39 @@ class TestFollowersListAPI:
 class TestFollowerDetailAPI:
     """Test GET/PUT/DELETE /api/authors/{serial}/followers/{fqid}/ endpoint"""
 
-    def test_check_if_following_exists(self, api_client, author_a, author_b):
+    def test_check_if_following_exists(
+            self, call_follower_detail, author_a, author_b):
         """Test checking if foreign author is following"""
         # Create accepted follow relationship
         FollowFactory.create_accepted(follower=author_b, following=author_a)
 
         # Use the foreign author's serial
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.get(url)
+        response = call_follower_detail('get', author_a, author_b)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['id'].endswith(f'/api/authors/{author_b.serial}/')
         assert response.data['type'] == 'author'
 
     def test_check_if_following_not_exists(
-            self, api_client, author_a, author_b):
+            self, call_follower_detail, author_a, author_b):
         """Test checking if foreign author is NOT following"""
         # No follow relationship exists
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.get(url)
+        response = call_follower_detail('get', author_a, author_b)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_check_if_following_pending_not_visible(
-            self, api_client, author_a, author_b):
+            self, call_follower_detail, author_a, author_b):
         """Test that pending follows don't show as following"""
         # Create pending follow relationship
         FollowFactory(follower=author_b, following=author_a, status='PENDING')
 
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.get(url)
+        response = call_follower_detail('get', author_a, author_b)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_approve_follow_request(self, api_client, author_a, author_b):
+    def test_approve_follow_request(
+            self, call_follower_detail, author_a, author_b):
         """Test approving a follow request (PUT)"""
         # Create pending follow request
         follow = FollowFactory(
@@ -137,89 +166,86 @@ class TestFollowerDetailAPI:
             status='PENDING')
 
         # Authenticate as the author who is being followed
-        api_client.force_authenticate(user=author_a)
-
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.put(url)
+        response = call_follower_detail(
+            'put', author_a, author_b, user=author_a)
 
         assert response.status_code == status.HTTP_200_OK
-        follow.refresh_from_db()
+        follow.refresh_from_db(fields=['status'])
         assert follow.status == 'ACCEPTED'
 
     def test_approve_follow_request_unauthorized(
-            self, api_client, author_a, author_b, author_c):
+            self, call_follower_detail, author_a, author_b, author_c):
         """Test that only the target author can approve follow requests"""
         # Create pending follow request
         FollowFactory(follower=author_b, following=author_a, status='PENDING')
 
         # Authenticate as a different author
-        api_client.force_authenticate(user=author_c)
-
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.put(url)
+        response = call_follower_detail(
+            'put', author_a, author_b, user=author_c)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_approve_nonexistent_follow_request(
-            self, api_client, author_a, author_b):
+            self, call_follower_detail, author_a, author_b):
         """Test approving a follow request that doesn't exist"""
-        api_client.force_authenticate(user=author_a)
-
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.put(url)
+        response = call_follower_detail(
+            'put', author_a, author_b, user=author_a)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_author_cannot_remove_follower(
-            self, api_client, author_a, author_b):
+            self, call_follower_detail, author_a, author_b):
         """Test that an author cannot remove their follower (DELETE)"""
         # Create accepted follow relationship where B follows A
         follow = FollowFactory.create_accepted(
             follower=author_b, following=author_a)
 
         # Authenticate as A (the one being followed)
-        api_client.force_authenticate(user=author_a)
-
-        url = f'/api/authors/{author_a.serial}/followers/{author_b.serial}/'
-
-        response = api_client.delete(url)
+        response = call_follower_detail(
+            'delete', author_a, author_b, user=author_a)
 
         # A should NOT be able to remove their follower B.
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert Follow.objects.filter(pk=follow.pk).exists()
 
-    def test_unfollow_author(self, api_client, author_a, author_b):
+    def test_unfollow_author(
+            self, call_follower_detail, author_a, author_b):
         """Test unfollowing another author (DELETE)"""
         # Create accepted follow relationship
         follow = FollowFactory.create_accepted(
             follower=author_a, following=author_b)
 
         # Authenticate as the follower
-        api_client.force_authenticate(user=author_a)
-
-        url = f'/api/authors/{author_b.serial}/followers/{author_a.serial}/'
-
-        response = api_client.delete(url)
+        response = call_follower_detail(
+            'delete', author_b, author_a, user=author_a)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Follow.objects.filter(pk=follow.pk).exists()
 
+    def test_unfollow_unknown_author(
+            self, call_follower_detail, author_a):
+        """An unknown author on either side of the follow is a 404"""
+        unknown = AuthorFactory.build()
+        node = RemoteNodeFactory()
+
+        response = call_follower_detail(
+            'delete', unknown, author_a, user=node)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        response = call_follower_detail(
+            'delete', author_a, unknown, user=node)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_unfollow_author_unauthorized(
-            self, api_client, author_a, author_b, author_c):
+            self, call_follower_detail, author_a, author_b, author_c):
         """Test that only a user in the relationship can unfollow"""
         # Create accepted follow relationship
         FollowFactory.create_accepted(
             follower=author_a, following=author_b)
 
         # Authenticate as a different author
-        api_client.force_authenticate(user=author_c)
-
-        url = f'/api/authors/{author_b.serial}/followers/{author_a.serial}/'
-
-        response = api_client.delete(url)
+        response = call_follower_detail(
+            'delete', author_b, author_a, user=author_c)
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -227,18 +253,27 @@ class TestFollowerDetailAPI:
 class TestInboxFollowRequests:
     """Test follow request handling in the inbox"""
 
+    # Every inbox test sends the follow request as author_b
+    default_auth = 'author_b'
+
+    @override_settings(ALLOWED_HOSTS=['api.example.com'])
+    def test_local_author_on_api_prefixed_host_is_not_remote(self):
+        """A node whose host begins with "api" keeps its authors local"""
+        request = APIRequestFactory().get('/', HTTP_HOST='api.example.com')
+        view = InboxView()
+
+        for host in ('http://api.example.com/', 'http://api.example.com',
+                     'http://api.example.com/api/'):
+            author = AuthorFactory.build(host=host)
+            assert not view._is_remote_author(author, request)
+        remote = AuthorFactory.build(host='http://apinode.example.com/')
+        assert view._is_remote_author(remote, request)
+
     def test_send_follow_request_to_inbox(
             self, api_client, author_a, author_b):
         """Test sending a follow request to another author's inbox"""
-        api_client.force_authenticate(user=author_b)
-
-        # Get the full, request-aware URL for the object (author_a)
-        object_res = api_client.get(f'/api/authors/{author_a.serial}/')
-        object_id = object_res.data['id']
-        print(f"object_id: {object_id}")
-        # Get the full, request-aware URL for the actor (author_b)
-        actor_res = api_client.get(f'/api/authors/{author_b.serial}/')
-        actor_id = actor_res.data['id']
+        object_id = author_a.get_api_url()
+        actor_id = author_b.get_api_url()
 
         url = f'/api/authors/{author_a.serial}/inbox/'
         data = {
@@ -277,9 +312,10 @@ class TestInboxFollowRequests:
         assert follow.status == Follow.Status.PENDING
 
     def test_send_follow_request_wrong_object(
-            self, api_client, author_a, author_b, author_c):
+            self, api_client, author_a, author_b):
         """Test sending follow request with wrong object (not inbox owner)"""
-        api_client.force_authenticate(user=author_b)
+        # Only its FQID is used, so the wrong object never needs a DB row
+        wrong_object = AuthorFactory.build()
 
         url = f'/api/authors/{author_a.serial}/inbox/'
         data = {
@@ -290,7 +326,7 @@ class TestInboxFollowRequests:
             },
             'object': {
                 'type': 'author',
-                'id': author_c.get_api_url(),  # Wrong object!
+                'id': wrong_object.get_api_url(),  # Wrong object!
             }
         }
 
@@ -298,19 +334,14 @@ class TestInboxFollowRequests:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_resend_follow_request(self, api_client, author_a, author_b):
+    def test_resend_follow_request(
+            self, api_client, author_a, author_b):
         """Test re-sending a previously rejected follow request"""
         # Create a rejected follow
         FollowFactory.create_rejected(follower=author_b, following=author_a)
 
-        api_client.force_authenticate(user=author_b)
-
-        # Get the full, request-aware URL for the object (author_a)
-        object_res = api_client.get(f'/api/authors/{author_a.serial}/')
-        object_id = object_res.data['id']
-        # Get the full, request-aware URL for the actor (author_b)
-        actor_res = api_client.get(f'/api/authors/{author_b.serial}/')
-        actor_id = actor_res.data['id']
+        object_id = author_a.get_api_url()
+        actor_id = author_b.get_api_url()
 
         url = f'/api/authors/{author_a.serial}/inbox/'
         data = {
@@ -331,3 +362,26 @@ class TestInboxFollowRequests:
         # Verify the follow request is now pending
         follow = Follow.objects.get(follower=author_b, following=author_a)
         assert follow.status == Follow.Status.PENDING
+
+    def test_inbox_owner_cache_holds_no_password(self, author_a):
+        """Only the columns the inbox needs are cached for its owner"""
+        get_inbox_owner(author_a.serial)
+
+        cached = cache.get(f'inbox_owner:{author_a.serial}')
+        assert set(cached) == set(INBOX_OWNER_FIELDS)
+        owner = get_inbox_owner(author_a.serial)
+        assert owner == author_a
+        assert owner.url == author_a.url
+
+    def test_deleted_inbox_owner_is_not_served_from_cache(self, api_client):
+        """Deleting an author clears their cached inbox owner lookup"""
+        # Function-scoped, since the class-scoped authors outlive the test
+        owner = AuthorFactory()
+        get_inbox_owner(owner.serial)
+        serial = owner.serial
+        owner.delete()
+
+        url = f'/api/authors/{serial}/inbox/'
+        response = api_client.post(url, {'type': 'follow'}, format='json')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -14,40 +14,35 @@ def api_client():
 
 
 @pytest.fixture
-def author_a():
-    """Create a test author"""
+def editable_author():
+    """Create a function-scoped author for tests that modify it"""
     return AuthorFactory()
 
 
-@pytest.fixture
-def author_b():
-    """Create another test author"""
-    return AuthorFactory()
-
-
-@pytest.fixture
-def setup_entries(author_a, author_b):
-    entry_author_a_1 = EntryFactory(
-        author=author_a, visibility='PUBLIC', is_deleted=False)
-    entry_author_a_2 = EntryFactory(
-        author=author_a, visibility='UNLISTED', is_deleted=False)
-    entry_author_a_3 = EntryFactory(
-        author=author_a, visibility='FRIENDS', is_deleted=False)
-    entry_author_a_4 = EntryFactory(
-        author=author_a, visibility='PUBLIC', is_deleted=False)
-
-    return (
-        entry_author_a_1, entry_author_a_2,
-        entry_author_a_3, entry_author_a_4
-    )
+@pytest.fixture(scope='class')
+def setup_entries(django_db_blocker, author_a, author_b):
+    """
+    Create author_a's entries once for the whole class. The tests only
+    read them, and they are deleted at class teardown.
+    """
+    with django_db_blocker.unblock():
+        entries = tuple(
+            EntryFactory(
+                author=author_a, visibility=visibility, is_deleted=False)
+            for visibility in ('PUBLIC', 'UNLISTED', 'FRIENDS', 'PUBLIC')
+        )
+    yield entries
+    with django_db_blocker.unblock():
+        for entry in entries:
+            entry.delete()
 
 
 @pytest.mark.django_db
 class TestProfilePageAPI:
 
-    def test_edit_profile(self, api_client, author_a):
-        api_client.force_authenticate(user=author_a)
-        url = f"/api/authors/{author_a.serial}/"
+    def test_edit_profile(self, api_client, editable_author):
+        api_client.force_authenticate(user=editable_author)
+        url = f"/api/authors/{editable_author.serial}/"
         updates = {
             "displayName": "Updated Name",
             "github": "https://github.com/updateduser",
@@ -57,16 +52,16 @@ class TestProfilePageAPI:
         response = api_client.patch(url, updates, format="json")
         assert response.status_code == status.HTTP_200_OK
 
-        author_a.refresh_from_db()
+        editable_author.refresh_from_db()
 
-        assert author_a.display_name == updates["displayName"]
-        assert author_a.github == updates["github"]
-        assert author_a.profile_image == updates["profileImage"]
+        assert editable_author.display_name == updates["displayName"]
+        assert editable_author.github == updates["github"]
+        assert editable_author.profile_image == updates["profileImage"]
 
     def test_profile_page(self, api_client, author_a, author_b, setup_entries):
 
         api_client.force_authenticate(user=author_b)
-        url = f'/api/authors/{author_a.serial}/entries/'
+        url = f'/api/authors/{author_a.serial}/entries/?lean=1'
         response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
 
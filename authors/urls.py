@@ -1,5 +1,8 @@
-from django.urls import path
+from django.urls import path, register_converter
 from . import views
+from .converters import SerialOrFqidConverter
+
+register_converter(SerialOrFqidConverter, 'soi')
 
 urlpatterns = [
     # General list view first is fine
@@ -25,25 +28,25 @@ urlpatterns = [
     ),
     # Follow-requests view
     path(
-        'authors/<path:serial_or_fqid>/follow-requests/',
+        'authors/<soi:serial_or_fqid>/follow-requests/',
         views.PendingFollowRequestsView.as_view(),
         name='follow-requests-list'
     ),
 
     path(
-        'authors/<path:serial_or_fqid>/following/',
+        'authors/<soi:serial_or_fqid>/following/',
         views.FollowingListView.as_view(),
         name='following-list'
     ),
 
     # Commented API
     path(
-        'authors/<path:serial_or_fqid>/commented/<uuid:comment_serial>/',
+        'authors/<soi:serial_or_fqid>/commented/<uuid:comment_serial>/',
         views.AuthorCommentedDetailView.as_view(),
         name='author-commented-detail'
     ),
     path(
-        'authors/<path:serial_or_fqid>/commented/',
+        'authors/<soi:serial_or_fqid>/commented/',
         views.AuthorCommentedListView.as_view(),
         name='author-commented-list'
     ),
@@ -55,12 +58,12 @@ urlpatterns = [
 
     # Liked API
     path(
-        'authors/<path:serial_or_fqid>/liked/<uuid:like_serial>/',
+        'authors/<soi:serial_or_fqid>/liked/<uuid:like_serial>/',
         views.AuthorLikedDetailView.as_view(),
         name='author-liked-detail'
     ),
     path(
-        'authors/<path:serial_or_fqid>/liked/',
+        'authors/<soi:serial_or_fqid>/liked/',
         views.AuthorLikedListView.as_view(),
         name='author-liked-list'
     ),
@@ -78,7 +81,7 @@ urlpatterns = [
     ),
 
     path(
-        'authors/<path:serial_or_fqid>/',
+        'authors/<soi:serial_or_fqid>/',
         views.AuthorDetailView.as_view(),
         name='author-detail'),
 ]
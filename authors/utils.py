@@ -1,14 +1,15 @@
+import re
 import urllib.parse
 import uuid
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
-from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.http import Http404
 from rest_framework.exceptions import (
     APIException
 )
-from entries.models import Entry, Comment
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -16,6 +17,36 @@ if TYPE_CHECKING:
 else:
     Author = get_user_model()
 
+# Canonical hyphenated UUID. Checking this first is much cheaper than
+# letting uuid.UUID() raise on input that is obviously not a serial.
+_UUID_RE = re.compile(
+    r'\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z',
+    re.IGNORECASE,
+)
+
+# An absolute URL, i.e. an author FQID. Captures the netloc and the last
+# path segment (the serial) in one match, as urlparse() would (the query
+# string and fragment are not part of the path).
+_FQID_RE = re.compile(
+    r'\A[^:/?#]+://([^/?#]*)[^?#]*/([^/?#]+)/*(?:[?#].*)?\Z',
+    re.DOTALL,
+)
+
+
+def _parse_serial(value):
+    """
+    Return `value` as a canonical (lowercase, hyphenated) UUID string, or
+    None if it is not a UUID. The canonical form is matched by _UUID_RE;
+    anything else falls back to uuid.UUID(), which also accepts 32 bare
+    hex digits, braces and the urn:uuid: prefix.
+    """
+    if _UUID_RE.match(value):
+        return value.lower()
+    try:
+        return str(uuid.UUID(value))
+    except ValueError:
+        return None
+
 
 class NotImplementedException(APIException):
     status_code = 501
@@ -29,6 +60,47 @@ class RemoteConnectionError(APIException):
     default_code = 'remote_connection_error'
 
 
+@lru_cache(maxsize=4096)
+def _classify_identifier(serial_or_fqid, local_host):
+    """
+    Parse and classify an author identifier without touching the database.
+
+    Returns one of:
+    - ('serial', serial) for a bare local serial
+    - ('local', serial) for an FQID on `local_host`
+    - ('remote', fqid) for an FQID on any other host
+    - ('invalid', message) when the identifier is malformed
+
+    The result only depends on its arguments, and the same author URLs are
+    requested over and over, so it is cached.
+    """
+    # Bare serials and already-decoded FQIDs have nothing to unquote
+    if '%' in serial_or_fqid:
+        decoded_identifier = urllib.parse.unquote(serial_or_fqid)
+    else:
+        decoded_identifier = serial_or_fqid
+
+    # Check if it's a URL (FQID).
+    if decoded_identifier.startswith('http'):
+        # Assumes the last part of the path is the author's serial
+        match = _FQID_RE.match(decoded_identifier)
+        author_serial = match and _parse_serial(match.group(2))
+        if not author_serial:
+            return ('invalid', "Author not found or invalid FQID format.")
+        netloc = match.group(1)
+
+        # Check if this FQID is local or remote by comparing hosts
+        if netloc == local_host:
+            return ('local', author_serial)
+        return ('remote', decoded_identifier)
+
+    # Not an FQID, treat as a direct serial.
+    author_serial = _parse_serial(decoded_identifier)
+    if not author_serial:
+        return ('invalid', "Author not found or invalid serial format.")
+    return ('serial', author_serial)
+
+
 def get_author_from_identifier(serial_or_fqid, request=None):
     """
     Helper method to resolve an author from a local serial or a
@@ -39,44 +111,73 @@ def get_author_from_identifier(serial_or_fqid, request=None):
     - If the identifier is a remote FQID, it returns the FQID string itself.
     - Raises Http404 for invalid formats.
     - When resolving an FQID, a `request` object must be provided.
+
+    When a request is given, results are memoized on it, so resolving the
+    same identifier again during that request does not query the database.
+    """
+    if request is None:
+        return _resolve_author_identifier(serial_or_fqid, None)
+
+    resolved = getattr(request, '_resolved_authors', None)
+    if resolved is None:
+        resolved = request._resolved_authors = {}
+    if serial_or_fqid not in resolved:
+        resolved[serial_or_fqid] = _resolve_author_identifier(
+            serial_or_fqid, request)
+    return resolved[serial_or_fqid]
+
+
+def _resolve_author_identifier(serial_or_fqid, request):
+    """Uncached body of get_author_from_identifier()."""
+    local_host = request.get_host() if request else None
+    kind, value = _classify_identifier(serial_or_fqid, local_host)
+
+    if kind != 'serial' and not request:
+        raise ValueError(
+            "A request object must be provided to resolve an FQID."
+        )
+    if kind == 'invalid':
+        raise Http404(value)
+    if kind == 'remote':
+        # It's a remote FQID. Return it for proxying.
+        return value
+    return get_object_or_404(Author, serial=value)
+
+
+@lru_cache(maxsize=4096)
+def get_serial_from_identifier(serial_or_fqid):
     """
-    decoded_identifier = urllib.parse.unquote(serial_or_fqid)
+    Return the author serial named by a serial or an FQID (local or remote)
+    without touching the database. Remote authors are stored as proxies
+    under the same serial, so the result can be looked up locally.
+    Raises Http404 for invalid formats.
+    """
+    kind, value = _classify_identifier(serial_or_fqid, None)
+    if kind == 'invalid':
+        raise Http404(value)
+    if kind == 'remote':
+        return _parse_serial(_FQID_RE.match(value).group(2))
+    return value
 
-    # Check if it's a URL (FQID).
-    if decoded_identifier.startswith('http'):
-        if not request:
-            raise ValueError(
-                "A request object must be provided to resolve an FQID."
-            )
-        try:
-            # Assumes the last part of the path is the author's serial
-            parsed_url = urllib.parse.urlparse(decoded_identifier)
-            author_serial = parsed_url.path.rstrip('/').split('/')[-1]
-            uuid.UUID(author_serial)  # Validate UUID format
-
-            # Check if this FQID is local or remote by comparing hosts
-            local_host = request.get_host()
-            if parsed_url.netloc == local_host:
-                # It's a local FQID.
-                return get_object_or_404(Author, serial=author_serial)
-            else:
-                # It's a remote FQID. Return it for proxying.
-                return decoded_identifier
-
-        except (ValueError, ValidationError, IndexError):
-            raise Http404(
-                "Author not found or invalid FQID format."
-            )
 
-    # Not an FQID, treat as a direct serial.
-    try:
-        # Validate if it's a UUID format
-        uuid.UUID(decoded_identifier)
-        # If it's a valid UUID format, look it up
-        return get_object_or_404(Author, serial=decoded_identifier)
-    except (ValueError, ValidationError):
-        # Not a valid UUID format or Django raised ValidationError.
-        raise Http404("Author not found or invalid serial format.")
+def get_current_host(request=None):
+    """
+    Return this node's host with a trailing slash, e.g.
+    'http://127.0.0.1:8000/'. Uses the request if available, caching the
+    value on it since it is needed once per serialized author; otherwise
+    falls back to settings.
+    """
+    if request:
+        current_host = getattr(request, '_current_host', None)
+        if current_host is None:
+            current_host = f"{request.scheme}://{request.get_host()}/"
+            request._current_host = current_host
+        return current_host
+    from django.conf import settings
+    current_host = getattr(settings, 'SITE_URL', 'http://127.0.0.1:8000/')
+    if not current_host.endswith('/'):
+        current_host += '/'
+    return current_host
 
 
 def get_or_create_proxy_author(author_data: dict, request=None) -> Author:
@@ -102,15 +203,7 @@ def get_or_create_proxy_author(author_data: dict, request=None) -> Author:
     if not author_url:
         raise ValueError("Author data must include an 'id' (URL).")
 
-    # Get current host - use request if available, otherwise fallback to
-    # settings
-    if request:
-        current_host = f"{request.scheme}://{request.get_host()}/"
-    else:
-        from django.conf import settings
-        current_host = getattr(settings, 'SITE_URL', 'http://127.0.0.1:8000/')
-        if not current_host.endswith('/'):
-            current_host += '/'
+    current_host = get_current_host(request)
 
     author_host = author_data.get('host', '')
     if not author_host.endswith('/'):
@@ -136,14 +229,9 @@ def get_or_create_proxy_author(author_data: dict, request=None) -> Author:
         if not author_serial:
             raise ValueError("Empty serial in URL")
 
-        # Validate UUID format - be more flexible with validation
-        try:
-            uuid_obj = uuid.UUID(author_serial)
-            author_serial = str(uuid_obj)  # Normalize the UUID format
-        except ValueError:
-            # If it's not a valid UUID, we still try to use it
-            # Some nodes might use different ID formats
-            pass
+        # Normalize the UUID format. If it's not a valid UUID, we still
+        # try to use it; some nodes might use different ID formats.
+        author_serial = _parse_serial(author_serial) or author_serial
 
     except (ValueError, IndexError) as e:
         raise ValueError(f"Invalid author URL format: {author_url} - {e}")
@@ -151,9 +239,11 @@ def get_or_create_proxy_author(author_data: dict, request=None) -> Author:
     try:
         # Try to get existing author by URL first
         author = Author.objects.get(url=author_url)
-        # Update existing author with new data
-        _update_author_fields(author, author_data)
-        author.save()
+        # Update existing author with new data, writing only the columns
+        # that actually changed (and nothing at all if none did)
+        changed_fields = _update_author_fields(author, author_data)
+        if changed_fields:
+            author.save(update_fields=changed_fields)
         return author
     except Author.DoesNotExist:
         # Create new proxy author
@@ -181,7 +271,17 @@ def get_or_create_proxy_author(author_data: dict, request=None) -> Author:
                         'unknown')}: {e}")
 
 
-def _update_author_fields(author: Author, author_data: dict) -> bool:
+# Pairs of (author_data key, Author model field) synced from remote data.
+# Built once at import instead of on every call.
+_AUTHOR_FIELD_MAPPINGS = (
+    ('displayName', 'display_name'),
+    ('github', 'github'),
+    ('profileImage', 'profile_image'),
+    ('host', 'host'),
+)
+
+
+def _update_author_fields(author: Author, author_data: dict) -> list:
     """
     Internal helper to update author fields with new data.
 
@@ -190,30 +290,112 @@ def _update_author_fields(author: Author, author_data: dict) -> bool:
         author_data: New author data from external source
 
     Returns:
-        bool: True if any fields were updated, False otherwise
+        list: Names of the model fields that were changed (empty if none)
     """
-    updated = False
-
-    # Map of author_data keys to Author model fields
-    field_mappings = {
-        'displayName': 'display_name',
-        'github': 'github',
-        'profileImage': 'profile_image',
-        'host': 'host',
-    }
+    updated = []
 
-    for data_key, model_field in field_mappings.items():
+    for data_key, model_field in _AUTHOR_FIELD_MAPPINGS:
         if data_key in author_data:
             new_value = author_data[data_key] or ''  # Handle None values
             current_value = getattr(author, model_field) or ''
 
             if new_value != current_value:
                 setattr(author, model_field, new_value)
-                updated = True
+                updated.append(model_field)
 
     return updated
 
 
+def bulk_upsert_proxy_authors(
+        authors_data, request=None, current_host=None) -> int:
+    """
+    Create or refresh proxy authors for a batch of remote author objects
+    in a few bulk statements, instead of one get_or_create_proxy_author()
+    round-trip per author.
+
+    Authors already stored under the same serial are updated in place, even
+    when their stored URL is a variant of the one received (e.g. with or
+    without a trailing slash); inserting those would violate the unique
+    serial and roll back the whole batch. The rest are inserted with
+    INSERT ... ON CONFLICT (url) DO UPDATE.
+
+    Entries without an id, authors hosted on this node and authors whose
+    serial is not a UUID are skipped.
+
+    The local host is taken from `current_host` when given (e.g. when no
+    request is available), otherwise from the request or settings.
+
+    Returns:
+        The number of proxy authors written.
+    """
+    if current_host is None:
+        current_host = get_current_host(request)
+
+    proxies = {}
+    for author_data in authors_data:
+        author_url = author_data.get('id')
+        if not author_url:
+            continue
+
+        author_host = author_data.get('host') or ''
+        if not author_host.endswith('/'):
+            author_host += '/'
+        if author_host == current_host:
+            continue
+
+        author_serial = urllib.parse.urlparse(
+            author_url).path.rstrip('/').split('/')[-1]
+        author_serial = _parse_serial(author_serial)
+        if not author_serial:
+            continue
+        serial = uuid.UUID(author_serial)
+
+        # Keyed on serial so a duplicated author in one batch is written
+        # once, whichever form its URL takes
+        proxies[serial] = (
+            {**author_data, 'host': author_host},
+            Author(
+                url=author_url,
+                serial=serial,
+                host=author_host,
+                display_name=author_data.get('displayName') or '',
+                github=author_data.get('github') or '',
+                profile_image=author_data.get('profileImage') or '',
+                # Remote authors are not active users on this system
+                is_active=False,
+                username=f"proxy_{uuid.uuid4()}_{author_serial[:8]}",
+            ),
+        )
+    written = len(proxies)
+
+    synced_fields = [model_field for _, model_field in _AUTHOR_FIELD_MAPPINGS]
+    changed = []
+    for author in Author.objects.only('serial', *synced_fields).filter(
+            serial__in=proxies):
+        author_data, _ = proxies.pop(author.serial)
+        if _update_author_fields(author, author_data):
+            changed.append(author)
+
+    with transaction.atomic():
+        Author.objects.bulk_update(changed, synced_fields, batch_size=500)
+        Author.objects.bulk_create(
+            [proxy for _, proxy in proxies.values()],
+            update_conflicts=True,
+            unique_fields=['url'],
+            update_fields=synced_fields,
+            batch_size=500,
+        )
+
+    # Neither bulk call sends post_save, which normally clears an author's
+    # cached inbox owner lookup; that entry holds the host, so clear it
+    # here for every author written. Imported here because authors.services
+    # imports this module.
+    from .services import clear_cached_inbox_owners
+    clear_cached_inbox_owners(
+        [author.serial for author in changed] + list(proxies))
+    return written
+
+
 def get_object_from_fqid(fqid: str):
     """
     Resolves a Fully Qualified ID (FQID) to a local model instance.
@@ -223,26 +405,35 @@ def get_object_from_fqid(fqid: str):
     - http://host/api/authors/{author_serial}/entries/{entry_serial}
     - http://host/api/authors/{author_serial}/comments/{comment_serial}
     """
+    # Imported here so that importing authors.utils does not pull in the
+    # entries app; only FQID resolution needs these models.
+    from entries.models import Entry, Comment
+
     try:
         # Normalize FQID by trying both with and without trailing slash
-        fqid_variants = [fqid]
-        if fqid.endswith('/'):
-            fqid_variants.append(fqid.rstrip('/'))
-        else:
-            fqid_variants.append(fqid + '/')
-
-        # First, try to find an Entry with any of these URL variants.
-        for url_variant in fqid_variants:
-            entry = Entry.objects.filter(url=url_variant).first()
-            if entry:
-                return entry
-
-        # If not an Entry, try to find a Comment with any of these URL
-        # variants.
-        for url_variant in fqid_variants:
-            comment = Comment.objects.filter(url=url_variant).first()
-            if comment:
-                return comment
+        fqid_variants = (
+            fqid,
+            fqid.rstrip('/') if fqid.endswith('/') else fqid + '/',
+        )
+
+        # Look for an Entry or a Comment with any of these URL variants.
+        # The url is the primary key, so a single IN lookup covers both.
+        # Comments come with their entry, which callers check visibility
+        # on.
+        lookups = (
+            Entry.objects.filter(url__in=fqid_variants),
+            Comment.objects.select_related('entry').filter(
+                url__in=fqid_variants),
+        )
+        # Comment FQIDs say so in their path (.../commented/... or
+        # .../comments/...), so try comments first for those; either way
+        # the usual case is answered by the first query.
+        if '/comment' in fqid:
+            lookups = lookups[::-1]
+        for queryset in lookups:
+            obj = queryset.first()
+            if obj:
+                return obj
 
         # Try to find comment by extracting UUID from /commented/ URLs
         # and matching against comment serial
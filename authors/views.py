@@ -1,23 +1,31 @@
-from rest_framework import generics, status, filters
-from rest_framework.renderers import JSONRenderer
+from rest_framework import generics, status
 from rest_framework.response import Response
-from django.db.models.signals import post_save
+from django.db import DataError, IntegrityError
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
-from authors.services import NodeService
+from django.utils.dateparse import parse_datetime
+from authors.services import (
+    NodeService, fan_out, get_active_remote_node, get_inbox_owner,
+    sync_remote_authors, sync_remote_authors_in_thread
+)
 from entries.models import VISIBILITY_CHOICES
 from entries.serializers import EntrySerializer
 from rest_framework.views import APIView
 from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from rest_framework.pagination import PageNumberPagination
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from drf_spectacular.utils import (
     extend_schema, OpenApiResponse, OpenApiExample, inline_serializer,
     OpenApiParameter
 )
 from rest_framework import serializers
 from .permissions import IsAuthenticatedOrReadOnlyForPublic
+from .filters import AuthorSearchFilter
 from entries.models import Entry, Comment, Like
 from entries.serializers import (
     CommentSerializer, LikeSerializer,
@@ -26,6 +34,8 @@ from entries.serializers import (
 )
 from .utils import (
     get_author_from_identifier,
+    get_current_host,
+    get_serial_from_identifier,
     RemoteConnectionError,
     get_object_from_fqid,
 )
@@ -33,15 +43,15 @@ import urllib.parse
 from django.http import Http404
 from rest_framework.permissions import IsAuthenticated
 import requests
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 import uuid
 from django.views.generic import TemplateView
 from .serializers import (
     AuthorSerializer, FollowSerializer, FollowersListSerializer,
     AuthorsListSerializer, FollowingListSerializer,
-    RemoteAuthorValidationSerializer, FriendsListSerializer
+    FriendsListSerializer, validate_remote_author
 )
-from .models import Follow
+from .models import Follow, with_follow_counts
 from .authentication import RemoteNodeAuthentication
 from .utils import get_or_create_proxy_author
 from requests.auth import HTTPBasicAuth
@@ -52,12 +62,55 @@ from rest_framework.authentication import (
 from .permissions import IsAuthenticatedOrRemoteNodeOrReadOnly
 from .permissions import CanPostToInbox
 from django.core.exceptions import ValidationError
+from .net import SESSION
+from django.conf import settings
+from django.core.cache import cache
+import threading
+import hashlib
+import re
+import time
 import logging
-logging.basicConfig(level=logging.DEBUG)
+
+logger = logging.getLogger(__name__)
 
 # Use the Author model consistently via get_user_model()
 Author = get_user_model()
 
+# Author columns read by AuthorSerializer. List views load only these,
+# skipping the AbstractUser account columns (password, email, ...).
+AUTHOR_SERIALIZER_FIELDS = (
+    'id', 'url', 'serial', 'host', 'display_name', 'github',
+    'profile_image',
+)
+# Cache key marking that remote authors were synced recently
+REMOTE_AUTHORS_SYNC_CACHE_KEY = 'remote_authors_sync:last'
+# A proxied remote author profile is served from cache without contacting
+# the remote node for this long, then revalidated with conditional headers
+REMOTE_AUTHOR_FRESH_SECONDS = 60
+# How long a proxied profile and its validators are kept for revalidation
+REMOTE_AUTHOR_CACHE_SECONDS = 60 * 60 * 24
+# Visibility values accepted on entries received through the inbox, keyed
+# case-insensitively
+VISIBILITY_BY_NAME = {
+    choice[0].lower(): choice[0] for choice in VISIBILITY_CHOICES}
+# How long the total behind a paginated comment or like list is reused
+ACTIVITY_COUNT_CACHE_SECONDS = 30
+
+
+def _activity_fqid_re(kind):
+    """
+    Compile a pattern for the path of an FQID ending in
+    .../authors/{author_serial}/{kind}/{serial}, capturing both serials.
+    The query string and fragment are not part of the path.
+    """
+    return re.compile(
+        r'\A[^?#]*/authors/([^/?#]+)/' + kind +
+        r'/([^/?#]+)/*(?:[?#].*)?\Z', re.DOTALL)
+
+
+_COMMENT_FQID_RE = _activity_fqid_re('commented')
+_LIKE_FQID_RE = _activity_fqid_re('liked')
+
 
 class StandardPagination(PageNumberPagination):
     page_size_query_param = 'size'
@@ -65,6 +118,90 @@ class StandardPagination(PageNumberPagination):
     max_page_size = 100
 
 
+def _activity_count_cache_keys(kind, author_url):
+    """
+    Cache keys for the number of `kind` ('commented' or 'liked') items by
+    the author at `author_url`, as seen by authenticated and anonymous
+    clients respectively.
+    """
+    digest = hashlib.sha256(author_url.encode()).hexdigest()
+    return [f'{kind}_count:{digest}:{scope}' for scope in ('all', 'public')]
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reads and stores its total count in the cache."""
+
+    def __init__(self, *args, count_cache_key=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @cached_property
+    def count(self):
+        if self.count_cache_key is None:
+            return super().count
+        count = cache.get(self.count_cache_key)
+        if count is None:
+            count = super().count
+            cache.set(self.count_cache_key, count,
+                      timeout=ACTIVITY_COUNT_CACHE_SECONDS)
+        return count
+
+
+class CachedCountPagination(StandardPagination):
+    """
+    StandardPagination that reuses the COUNT(*) behind each page, keyed by
+    the view's get_count_cache_key(). Saving or deleting a comment or like
+    clears its author's counts.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count_cache_key = view.get_count_cache_key() if view else None
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def django_paginator_class(self, queryset, page_size):
+        # DRF builds the paginator through this attribute
+        return CachedCountPaginator(
+            queryset, page_size, count_cache_key=self.count_cache_key)
+
+
+class ActivityCountCacheMixin:
+    """
+    For the lists of what an author has commented on or liked. Pages are
+    counted through CachedCountPagination, per author and per
+    authenticated/anonymous visibility scope. `count_cache_kind` is
+    'commented' or 'liked'.
+    """
+    pagination_class = CachedCountPagination
+    count_cache_kind = None
+
+    def get_count_cache_key(self):
+        author = get_author_from_identifier(
+            self.kwargs['serial_or_fqid'], self.request)
+        if isinstance(author, str):
+            return None
+        all_key, public_key = _activity_count_cache_keys(
+            self.count_cache_kind, author.url)
+        return all_key if self.request.user.is_authenticated else public_key
+
+
+class OptionalPaginationMixin:
+    """
+    For list views whose spec returns every item in one response. When the
+    client passes ?page= or ?size=, only that page of the queryset is
+    returned (same response shape, StandardPagination page sizes).
+    Otherwise the rows are streamed from the database in chunks instead of
+    being loaded into the queryset result cache all at once.
+    """
+    iterator_chunk_size = 200
+
+    def paginate_if_requested(self, queryset, request):
+        if ('page' not in request.query_params and
+                'size' not in request.query_params):
+            return queryset.iterator(chunk_size=self.iterator_chunk_size)
+        return StandardPagination().paginate_queryset(
+            queryset.order_by('id'), request, view=self)
+
+
 @extend_schema(
     summary="List All Authors",
     description=(
@@ -172,7 +309,7 @@ class AuthorListView(generics.ListAPIView):
     pagination_class = StandardPagination
     authentication_classes = [RemoteNodeAuthentication, SessionAuthentication]
     permission_classes = [IsAuthenticatedOrRemoteNodeOrReadOnly]
-    filter_backends = [filters.SearchFilter]
+    filter_backends = [AuthorSearchFilter]
     search_fields = ['display_name']
 
     def get_queryset(self):
@@ -184,78 +321,76 @@ class AuthorListView(generics.ListAPIView):
         proxy authors (for search)
         """
         # Build current host from the request
-        current_host = f"{self.request.scheme}://{self.request.get_host()}/"
+        current_host = get_current_host(self.request)
 
         # Check if request is from a remote node
         if isinstance(getattr(self.request, 'user', None), RemoteNode):
             # Remote nodes should only get local authors to prevent proxy
             # recursion
-            return Author.objects.filter(is_active=True, host=current_host)
+            authors = Author.objects.filter(
+                is_active=True, host=current_host)
+        else:
+            # Local users get both local active authors AND remote proxy
+            # authors
+            authors = Author.objects.filter(
+                Q(is_active=True, host=current_host) |  # Local active authors
+                # Remote authors (any host != current; host is never null)
+                ~Q(host=current_host)
+            )
 
-        # Local users get both local active authors AND remote proxy authors
-        return Author.objects.filter(
-            Q(is_active=True, host=current_host) |  # Local active authors
-            # Remote authors (any host != current)
-            Q(host__isnull=False) & ~Q(host=current_host)
-        )
+        # Order by the primary key so page boundaries are stable and the
+        # LIMIT/OFFSET walk follows the primary key index.
+        return with_follow_counts(
+            authors.only(*AUTHOR_SERIALIZER_FIELDS).order_by('id'))
 
     def _fetch_remote_authors(self):
         """
-        Iterate through all active remote nodes and fetch their author lists.
-        This will populate our database with proxy objects for remote authors.
+        Sync proxy authors from every active remote node, using this
+        request's host to tell local authors from remote ones.
         """
-        remote_nodes = RemoteNode.objects.filter(is_active=True)
-        logging.debug(
-            f"Fetching remote authors from {len(remote_nodes)} nodes.")
-        for node in remote_nodes:
-            try:
-                auth = HTTPBasicAuth(
-                    node.outgoing_username,
-                    node.outgoing_password)
-                response = requests.get(
-                    f"{node.host}/api/authors/",
-                    auth=auth,
-                    headers={'Accept': 'application/json'},
-                    timeout=5
-                )
-                response.raise_for_status()
-                authors_data = response.json()
-
-                for author_data in authors_data.get('authors', []):
-                    # Use our utility to create proxy authors. This will
-                    # either create a new proxy or update an existing one.
-                    try:
-                        logging.debug(
-                            f"Getting/Creating proxy author: "
-                            f"{author_data['displayName']}")
-                        get_or_create_proxy_author(author_data, self.request)
-                    except Exception as e:
-                        logging.warning(
-                            "Exception while getting/creating proxy author "
-                            "(%s): %s",
-                            author_data["id"],
-                            e
-                        )
+        sync_remote_authors(get_current_host(self.request))
 
-            except requests.exceptions.RequestException:
-                logging.warning(
-                    "RequestException while fetching remote authors: %s",
-                    node.host)
-            except Exception as e:
-                logging.warning(
-                    "Exception while fetching remote authors: %s. %s",
-                    node.host, e)
+    def _start_remote_author_sync(self):
+        """
+        Sync remote authors without making the current request wait for
+        the remote nodes; the listing is served from the proxy authors
+        already stored. The sync runs inline when
+        REMOTE_AUTHORS_SYNC_IN_BACKGROUND is False.
+        """
+        if not settings.REMOTE_AUTHORS_SYNC_IN_BACKGROUND:
+            self._fetch_remote_authors()
+            return
+        threading.Thread(
+            target=sync_remote_authors_in_thread,
+            args=(get_current_host(self.request),),
+            daemon=True,
+        ).start()
+
+    def _should_sync_remote_authors(self, request):
+        """
+        Decide whether this request should sync remote authors. The cheap
+        checks come first, so only an unfiltered first page requested by
+        a local user can trigger a sync, and at most once every
+        REMOTE_AUTHORS_SYNC_INTERVAL seconds. cache.add() is atomic, so
+        concurrent requests cannot both start a sync.
+        """
+        # Requests from remote nodes never sync. This prevents an infinite
+        # loop where nodes continuously ask each other for authors.
+        if isinstance(request.user, RemoteNode):
+            return False
+        if request.query_params.get('page', '1') != '1':
+            return False
+        # Searches only look at authors we already know about
+        if request.query_params.get(AuthorSearchFilter.search_param):
+            return False
+        return cache.add(
+            REMOTE_AUTHORS_SYNC_CACHE_KEY, True,
+            timeout=settings.REMOTE_AUTHORS_SYNC_INTERVAL)
 
     def list(self, request, *args, **kwargs):
-        # Only fetch remote authors if the request is from a
-        # local user (not a remote node).
-        # This check prevents an infinite loop where nodes continuously ask
-        # each other for authors.
-        if not isinstance(request.user, RemoteNode):
-            logging.debug("Fetching remote authors for local user request.")
-            self._fetch_remote_authors()
-        else:
-            logging.debug("Serving remote node request.")
+        if self._should_sync_remote_authors(request):
+            logger.debug("Syncing remote authors for local user request.")
+            self._start_remote_author_sync()
 
         queryset = self.filter_queryset(self.get_queryset())
         page = self.paginate_queryset(queryset)
@@ -443,22 +578,7 @@ class AuthorDetailView(generics.RetrieveUpdateAPIView):
         elif isinstance(author_or_fqid, str):
             remote_url = author_or_fqid
             try:
-                # TODO: Add authentication headers for remote requests
-                # from other nodes.
-                remote_response = requests.get(remote_url, timeout=5)
-                remote_response.raise_for_status()
-                response_json = remote_response.json()
-
-                # Use the validation serializer to ensure the remote data
-                # has the required structure before proxying.
-                serializer = RemoteAuthorValidationSerializer(
-                    data=response_json)
-                serializer.is_valid(raise_exception=True)
-
-                # Return the original, validated data
-                return Response(
-                    serializer.validated_data,
-                    status=remote_response.status_code)
+                return Response(self._get_remote_author(remote_url))
             except (
                 requests.exceptions.RequestException,
                 requests.exceptions.JSONDecodeError,
@@ -474,6 +594,61 @@ class AuthorDetailView(generics.RetrieveUpdateAPIView):
             status=status.HTTP_400_BAD_REQUEST
         )
 
+    @staticmethod
+    def _get_remote_author(remote_url):
+        """
+        Fetch and validate a remote author, caching the result.
+
+        A cached profile is served as-is for REMOTE_AUTHOR_FRESH_SECONDS.
+        After that the remote node is asked again with If-None-Match /
+        If-Modified-Since, and a 304 reuses the cached profile without
+        re-validating it.
+        """
+        cache_key = (
+            'remote_author:' + hashlib.sha256(remote_url.encode()).hexdigest())
+        cached = cache.get(cache_key)
+        if cached and cached['fresh_until'] > time.time():
+            return cached['data']
+
+        headers = {'Accept': 'application/json'}
+        if cached and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        # Authenticate with the node's outgoing credentials, as every other
+        # request to a remote node does. Unregistered nodes are still asked
+        # anonymously, since author profiles may be public there.
+        parsed_url = urllib.parse.urlparse(remote_url)
+        remote_node = get_active_remote_node(
+            f"{parsed_url.scheme}://{parsed_url.netloc}/")
+        auth = None
+        if remote_node:
+            auth = HTTPBasicAuth(
+                remote_node.outgoing_username,
+                remote_node.outgoing_password)
+
+        remote_response = SESSION.get(
+            remote_url, headers=headers, auth=auth, timeout=5)
+        if cached and remote_response.status_code == 304:
+            data = cached['data']
+        else:
+            remote_response.raise_for_status()
+            # Ensure the remote data has the required structure before
+            # proxying.
+            data = validate_remote_author(remote_response.json())
+
+        cache.set(cache_key, {
+            'data': data,
+            'etag': remote_response.headers.get(
+                'ETag', cached['etag'] if cached else None),
+            'last_modified': remote_response.headers.get(
+                'Last-Modified',
+                cached['last_modified'] if cached else None),
+            'fresh_until': time.time() + REMOTE_AUTHOR_FRESH_SECONDS,
+        }, timeout=REMOTE_AUTHOR_CACHE_SECONDS)
+        return data
+
     def update(self, request, *args, **kwargs):
         """
         Handle author updates:
@@ -490,7 +665,7 @@ class AuthorDetailView(generics.RetrieveUpdateAPIView):
             except (Author.DoesNotExist, ValueError):
                 raise Http404("Author not found")
 
-            current_host = f"{request.scheme}://{request.get_host()}/"
+            current_host = get_current_host(request)
 
             # Remote node can only update proxy authors from their own host
             if author.host and author.host != current_host:
@@ -579,7 +754,7 @@ class AuthorDetailView(generics.RetrieveUpdateAPIView):
     },
     tags=['Followers']
 )
-class FollowersListView(APIView):
+class FollowersListView(OptionalPaginationMixin, APIView):
     """
     GET /api/authors/{serial}/followers/ [local, remote]
     - get list of authors who are following this author
@@ -587,8 +762,12 @@ class FollowersListView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnlyForPublic]
 
     def get(self, request, *args, **kwargs):
-        author = get_object_or_404(Author, serial=self.kwargs['serial'])
-        followers = author.get_followers()
+        # Only the url is read, as the key of the follow relations
+        author = get_object_or_404(
+            Author.objects.only('id', 'url'), serial=self.kwargs['serial'])
+        followers = with_follow_counts(
+            author.get_followers().only(*AUTHOR_SERIALIZER_FIELDS))
+        followers = self.paginate_if_requested(followers, request)
         serializer = AuthorSerializer(
             followers, many=True, context={'request': request}
         )
@@ -644,7 +823,7 @@ class FollowersListView(APIView):
     },
     tags=['Followers']
 )
-class FollowingListView(APIView):
+class FollowingListView(OptionalPaginationMixin, APIView):
     """
     GET /api/authors/{serial}/following/ [local, remote]
     - get list of authors this author is following
@@ -653,7 +832,9 @@ class FollowingListView(APIView):
 
     def get(self, request, *args, **kwargs):
         author = get_author_from_identifier(self.kwargs['serial_or_fqid'])
-        following = author.get_following()
+        following = with_follow_counts(
+            author.get_following().only(*AUTHOR_SERIALIZER_FIELDS))
+        following = self.paginate_if_requested(following, request)
         serializer = AuthorSerializer(
             following, many=True, context={'request': request}
         )
@@ -684,7 +865,7 @@ class FollowingListView(APIView):
     },
     tags=["Followers"],
 )
-class FriendsListView(APIView):
+class FriendsListView(OptionalPaginationMixin, APIView):
     """
     GET /api/authors/{serial}/friends/
     - get list of authors who are friends with this author (mutual follow)
@@ -693,8 +874,12 @@ class FriendsListView(APIView):
     permission_classes = [IsAuthenticatedOrReadOnlyForPublic]
 
     def get(self, request, *args, **kwargs):
-        author = get_object_or_404(Author, serial=self.kwargs["serial"])
-        friends = author.get_friends()
+        # Only the url is read, as the key of the follow relations
+        author = get_object_or_404(
+            Author.objects.only('id', 'url'), serial=self.kwargs['serial'])
+        friends = with_follow_counts(
+            author.get_friends().only(*AUTHOR_SERIALIZER_FIELDS))
+        friends = self.paginate_if_requested(friends, request)
         serializer = AuthorSerializer(
             friends, many=True, context={'request': request}
         )
@@ -758,49 +943,33 @@ class FollowerDetailView(APIView):
         }
     )
     def get(self, request, *args, **kwargs):
-        followed_author = get_object_or_404(
-            Author, serial=kwargs['serial']
-        )
-        identifier = kwargs['foreign_author_fqid']
-
         try:
-            # This function can return either an Author object or a URL string
-            resolved_follower = get_author_from_identifier(identifier, request)
+            # Local serial, local FQID or remote FQID; remote authors are
+            # looked up through their local proxy, which shares the serial.
+            follower_serial = get_serial_from_identifier(
+                kwargs['foreign_author_fqid'])
         except Http404:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        # If the resolved follower is a string, it's a remote author URL.
-        # We need to parse the UUID from it and find the local proxy object.
-        if isinstance(resolved_follower, str):
-            try:
-                parsed_url = urllib.parse.urlparse(resolved_follower)
-                follower_uuid = parsed_url.path.rstrip('/').split('/')[-1]
-                # Now find the local proxy author object by its serial
-                follower_author_obj = get_object_or_404(
-                    Author, serial=follower_uuid
-                )
-            except (ValueError, IndexError):
-                return Response(status=status.HTTP_404_NOT_FOUND)
-        else:
-            # It's already a local Author object
-            follower_author_obj = resolved_follower
+        # A single query finds the follower only if the accepted follow
+        # exists, with the counts the serializer needs annotated on it.
+        follower_author_obj = with_follow_counts(Author.objects.filter(
+            serial=follower_serial,
+            following_relationships__following__serial=kwargs['serial'],
+            following_relationships__status=Follow.Status.ACCEPTED,
+        )).first()
 
-        # Now we can safely check the follow relationship
-        if Follow.objects.filter(
-            follower=follower_author_obj,
-            following=followed_author,
-            status=Follow.Status.ACCEPTED
-        ).exists():
-            serializer = AuthorSerializer(
-                follower_author_obj, context={'request': request}
-            )
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        else:
+        if follower_author_obj is None:
             return Response(
                 {"detail": "Foreign author is not following this author"},
                 status=status.HTTP_404_NOT_FOUND
             )
 
+        serializer = AuthorSerializer(
+            follower_author_obj, context={'request': request}
+        )
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
     @extend_schema(
         summary="Approve Follow Request",
         description=(
@@ -840,47 +1009,38 @@ class FollowerDetailView(APIView):
     )
     def put(self, request, *args, **kwargs):
         """Handle PUT requests for approving follow requests"""
-        followed_author = get_object_or_404(Author, serial=kwargs['serial'])
-
-        # The user must be authenticated and must be the one being followed
+        # The user must be authenticated and must be the one being followed,
+        # in which case the followed author is the user and needs no query
         if (request.user.is_anonymous or
-                request.user.serial != followed_author.serial):
+                request.user.serial != kwargs['serial']):
+            get_object_or_404(
+                Author.objects.only('id'), serial=kwargs['serial'])
             return Response(status=status.HTTP_403_FORBIDDEN)
+        followed_author = request.user
 
         try:
-            foreign_author_identifier = get_author_from_identifier(
-                self.kwargs['foreign_author_fqid'], request)
-
-            if isinstance(foreign_author_identifier, str):
-                # It's a remote author FQID string. We need to find the local
-                # proxy object that represents them.
-                parsed_url = urllib.parse.urlparse(foreign_author_identifier)
-                author_serial = parsed_url.path.rstrip('/').split('/')[-1]
-                foreign_author = get_object_or_404(
-                    Author, serial=author_serial)
-            else:
-                # It's a local author object.
-                foreign_author = foreign_author_identifier
+            follower_serial = get_serial_from_identifier(
+                self.kwargs['foreign_author_fqid'])
         except Http404:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        # Find and approve the follow request
-        try:
-            follow = Follow.objects.get(
-                follower=foreign_author,
-                following=followed_author
-            )
-            follow.approve()
-
-            serializer = AuthorSerializer(
-                foreign_author, context={
-                    'request': request})
-            return Response(serializer.data)
-        except Follow.DoesNotExist:
+        # Find the follow request and its follower in one query. A remote
+        # follower is stored as a proxy under the same serial.
+        follow = Follow.objects.select_related('follower').filter(
+            follower__serial=follower_serial,
+            following=followed_author,
+        ).first()
+        if follow is None:
             return Response(
                 {"detail": "No follow request found from this author"},
                 status=status.HTTP_404_NOT_FOUND
             )
+        follow.approve()
+
+        serializer = AuthorSerializer(
+            follow.follower, context={
+                'request': request})
+        return Response(serializer.data)
 
     @extend_schema(
         summary="Unfollow an Author or Reject a Follow Request",
@@ -924,43 +1084,45 @@ class FollowerDetailView(APIView):
     )
     def delete(self, request, *args, **kwargs):
         """Handle DELETE requests for unfollowing or rejecting requests."""
-        followed_author = get_object_or_404(Author, serial=kwargs['serial'])
-
+        # Only the two serials are needed, so neither Author row is loaded.
+        # A remote follower is stored as a proxy under the same serial.
+        followed_serial = str(kwargs['serial'])
         try:
-            foreign_author_identifier = get_author_from_identifier(
-                self.kwargs['foreign_author_fqid'], request)
-
-            if isinstance(foreign_author_identifier, str):
-                # It's a remote author FQID string. We need to find the local
-                # proxy object that represents them.
-                parsed_url = urllib.parse.urlparse(foreign_author_identifier)
-                author_serial = parsed_url.path.rstrip('/').split('/')[-1]
-                follower_author = get_object_or_404(
-                    Author, serial=author_serial)
-            else:
-                # It's a local author object.
-                follower_author = foreign_author_identifier
-        except (Http404, ValueError, IndexError):
+            follower_serial = get_serial_from_identifier(
+                self.kwargs['foreign_author_fqid']).lower()
+        except Http404:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
+        # An unknown author is a 404 whoever is asking (including a remote
+        # node), so both are checked, in one query, before the user is
+        # inspected
+        serials = {followed_serial, follower_serial}
+        if Author.objects.filter(serial__in=serials).count() < len(serials):
+            return Response(
+                {"detail": "Author not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
         if not request.user.is_authenticated:
             return Response(
                 {"detail": "Authentication credentials were not provided."},
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        try:
-            follow = Follow.objects.get(
-                follower=follower_author, following=followed_author)
-        except Follow.DoesNotExist:
+        follow = Follow.objects.filter(
+            follower__serial=follower_serial,
+            following__serial=followed_serial,
+        ).only('pk', 'status').first()
+        if follow is None:
             return Response(
                 {"detail": "Follow relationship not found"},
                 status=status.HTTP_404_NOT_FOUND
             )
 
         # Permission checks
-        is_follower = request.user.serial == follower_author.serial
-        is_followed = request.user.serial == followed_author.serial
+        user_serial = str(request.user.serial)
+        is_follower = user_serial == follower_serial
+        is_followed = user_serial == followed_serial
 
         # A follower can unfollow at any time.
         if is_follower:
@@ -1030,15 +1192,16 @@ class AuthorProfilePageView(TemplateView):
             author=author_to_view,
             visibility__in=visible_statuses,
             is_deleted=False
-        ).order_by('-published')
+        ).select_related('author').order_by('-published')
 
         context['is_friend'] = is_friend
         context['currentAuthor'] = viewer
 
         serializer = EntrySerializer(entries, many=True, context={
                                      'request': self.request})
-        entries_json = JSONRenderer().render(serializer.data).decode('utf-8')
-        context['entries_json'] = entries_json
+        # Encoded once by the template's json_script filter, which also
+        # makes it safe to embed in the page
+        context['entries_data'] = serializer.data
         return context
 
 
@@ -1253,36 +1416,37 @@ class InboxView(APIView):
     authentication_classes = [RemoteNodeAuthentication, SessionAuthentication]
     permission_classes = [CanPostToInbox]
 
+    # Handler method for each supported object 'type'
+    HANDLERS = {
+        'follow': '_handle_follow_request',
+        'like': '_handle_like',
+        'comment': '_handle_comment',
+        'entry': '_handle_entry',
+    }
+
     def post(self, request, author_serial):
         """
         Handles POST requests to an author's inbox. It routes the request
         to the appropriate handler based on the object's 'type'.
         """
-        inbox_owner = get_object_or_404(Author, serial=author_serial)
+        inbox_owner = get_inbox_owner(author_serial)
+        data = request.data
 
         # Check if this is a request for a remote author (proxy)
         # If so, forward it to the remote node instead of processing locally
         if self._is_remote_author(inbox_owner, request):
-            return self._forward_to_remote_inbox(inbox_owner, request.data)
+            return self._forward_to_remote_inbox(inbox_owner, data)
 
-        data = request.data
         obj_type = data.get('type', '').lower()
 
-        handler_map = {
-            'follow': self._handle_follow_request,
-            'like': self._handle_like,
-            'comment': self._handle_comment,
-            'entry': self._handle_entry,
-        }
-
-        handler = handler_map.get(obj_type)
-        if not handler:
+        handler_name = self.HANDLERS.get(obj_type)
+        if not handler_name:
             return Response(
                 {"detail": f"Object type '{obj_type}' not supported."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        return handler(request, inbox_owner)
+        return getattr(self, handler_name)(request, inbox_owner)
 
     def _forward_activity_to_owner(self, activity_data, target_object):
         """
@@ -1308,8 +1472,7 @@ class InboxView(APIView):
             return
 
         # Find the remote node configuration to get auth credentials
-        remote_node = RemoteNode.objects.filter(
-            host__startswith=owner.host, is_active=True).first()
+        remote_node = get_active_remote_node(owner.host.rstrip('/') + '/')
         if not remote_node:
             return
 
@@ -1320,7 +1483,7 @@ class InboxView(APIView):
             remote_node.outgoing_password)
 
         try:
-            requests.post(
+            SESSION.post(
                 inbox_url,
                 json=activity_data,
                 auth=auth,
@@ -1371,33 +1534,53 @@ class InboxView(APIView):
                     "detail": "Entry must include a unique 'id' or 'url'."},
                 status=status.HTTP_400_BAD_REQUEST)
 
-        existing_entry = Entry.objects.filter(url=entry_url).first()
+        # The author is joined in because the post_save fan-out reads it
+        existing_entry = Entry.objects.select_related('author').filter(
+            url=entry_url).first()
 
         # Validate visibility
-        incoming_visibility = entry_data.get('visibility', 'PUBLIC').upper()
-        valid_visibilities = [choice[0] for choice in VISIBILITY_CHOICES]
-        if incoming_visibility not in valid_visibilities:
+        raw_visibility = entry_data.get('visibility', 'PUBLIC')
+        incoming_visibility = VISIBILITY_BY_NAME.get(raw_visibility.lower())
+        if incoming_visibility is None:
             return Response(
-                {"detail": f"Invalid visibility: '{incoming_visibility}'"},
+                {"detail": f"Invalid visibility: '{raw_visibility}'"},
                 status=status.HTTP_400_BAD_REQUEST)
+        is_deleted = incoming_visibility == 'DELETED'
+        published = entry_data.get('published')
 
         try:
             if existing_entry:
-                # Update existing entry
-                existing_entry.title = entry_data.get(
-                    'title', existing_entry.title)
-                existing_entry.description = entry_data.get(
-                    'description', existing_entry.description)
-                existing_entry.content_type = entry_data.get(
-                    'contentType', existing_entry.content_type)
-                existing_entry.content = entry_data.get(
-                    'content', existing_entry.content)
-                existing_entry.visibility = incoming_visibility
-                if incoming_visibility == 'DELETED':
-                    existing_entry.is_deleted = True
-                if entry_data.get('published'):
-                    existing_entry.published = entry_data.get('published')
-                existing_entry.save()
+                # Update existing entry, writing only the columns whose
+                # value actually changed
+                incoming = {
+                    'title': entry_data.get('title', existing_entry.title),
+                    'description': entry_data.get(
+                        'description', existing_entry.description),
+                    'content_type': entry_data.get(
+                        'contentType', existing_entry.content_type),
+                    'content': entry_data.get(
+                        'content', existing_entry.content),
+                    'visibility': incoming_visibility,
+                }
+                if is_deleted:
+                    incoming['is_deleted'] = True
+                if published:
+                    # Compared as a datetime; anything unparseable is left
+                    # for save() to reject
+                    incoming['published'] = (
+                        parse_datetime(published)
+                        if isinstance(published, str) else None
+                    ) or published
+                update_fields = [
+                    field for field, value in incoming.items()
+                    if getattr(existing_entry, field) != value]
+                # A redelivered, unchanged entry is not saved, so it is
+                # not fanned out again either
+                if update_fields:
+                    for field in update_fields:
+                        setattr(existing_entry, field, incoming[field])
+                    existing_entry.save(
+                        update_fields=update_fields + ['updated'])
                 return Response({"detail": "Entry updated successfully."},
                                 status=status.HTTP_200_OK)
             else:
@@ -1410,12 +1593,14 @@ class InboxView(APIView):
                     content_type=entry_data.get('contentType', 'text/plain'),
                     content=entry_data.get('content', ''),
                     visibility=incoming_visibility,
-                    published=entry_data.get('published'),
-                    is_deleted=incoming_visibility == 'DELETED',
+                    published=published,
+                    is_deleted=is_deleted,
                 )
                 return Response({"detail": "Entry received and saved."},
                                 status=status.HTTP_201_CREATED)
-        except Exception as e:
+        except (IntegrityError, DataError, ValidationError, ValueError) as e:
+            # Malformed remote data (bad timestamps, over-long fields,
+            # conflicting ids); anything else is a bug and should surface
             return Response({"detail": f"Failed to save entry locally: {e}"},
                             status=status.HTTP_400_BAD_REQUEST)
 
@@ -1427,19 +1612,14 @@ class InboxView(APIView):
         if not author.host:
             return False
 
-        current_host = f"{request.scheme}://{request.get_host()}/"
-        author_host = author.host.rstrip('/') + '/'
-
-        # Handle cases where author.host includes '/api/' suffix
-        current_base = current_host.rstrip('/')
-        author_base = author_host.rstrip('/').replace('/api', '')
-
-        # If the base hosts match, this is a local author
-        if author_base == current_base:
-            return False
-
-        # If hosts differ, this is a remote author
-        return author_host != current_host
+        # Compare base hosts, ignoring trailing slashes and an '/api'
+        # suffix on author.host. Only a trailing '/api' segment is dropped,
+        # so hosts that begin with "api" (http://api.example.com/) still
+        # match. The current host never has a path, so any other
+        # difference means the author is remote.
+        current_base = get_current_host(request)[:-1]
+        author_base = author.host.rstrip('/').removesuffix('/api')
+        return author_base != current_base
 
     def _forward_to_remote_inbox(self, remote_author, data):
         """
@@ -1505,38 +1685,53 @@ class InboxView(APIView):
                     return
 
                 # "A's node can assume that A is following B"
-                # Create or update the local follow relationship
-                follow, created = Follow.objects.get_or_create(
-                    follower=local_actor,
-                    following=remote_author,
-                    defaults={'status': Follow.Status.ACCEPTED}
+                # Create the local follow relationship, or mark an existing
+                # one accepted, in a single upsert on (follower, following)
+                Follow.objects.bulk_create(
+                    [Follow(
+                        follower=local_actor,
+                        following=remote_author,
+                        status=Follow.Status.ACCEPTED)],
+                    update_conflicts=True,
+                    unique_fields=['follower', 'following'],
+                    update_fields=['status', 'updated_at'],
                 )
 
-                if not created and follow.status != Follow.Status.ACCEPTED:
-                    # Update existing relationship to accepted
-                    follow.status = Follow.Status.ACCEPTED
-                    follow.save()
-
-            except Exception:
+            except IntegrityError:
                 # Don't fail the whole request if local relationship creation
                 # fails
                 pass
 
-    def _user_can_view_entry(self, user, entry):
-        """Check if a user has permission to view an entry."""
-        if entry.visibility in ['PUBLIC', 'UNLISTED']:
+    def _user_can_view_entry(self, request, user, entry):
+        """
+        Check if a user has permission to view an entry. The user's friends
+        are loaded once per request and shared by every check.
+        """
+        if entry.visibility in ('PUBLIC', 'UNLISTED'):
             return True
 
         if not user.is_authenticated:
             return False
 
-        if entry.author == user:
+        # Entry.author points at Author.url, so this needs no query
+        if entry.author_id == user.url:
             return True
 
-        if entry.visibility == 'FRIENDS':
-            return user.is_friend_with(entry.author)
+        if entry.visibility != 'FRIENDS':
+            return False
+
+        return entry.author_id in self._get_friend_urls(request, user)
 
-        return False
+    @staticmethod
+    def _get_friend_urls(request, user):
+        """Return the set of `user`'s friends' URLs, memoized on request."""
+        friend_urls = getattr(request, '_friend_urls', None)
+        if friend_urls is None:
+            friend_urls = request._friend_urls = {}
+        if user.pk not in friend_urls:
+            friend_urls[user.pk] = set(
+                user.get_friends().values_list('url', flat=True))
+        return friend_urls[user.pk]
 
     def _handle_follow_request(self, request, inbox_owner):
         """
@@ -1549,20 +1744,12 @@ class InboxView(APIView):
         object_id = object_data.get('id')
 
         # Check if the object ID matches either the stored FQID or the API URL
-        # Normalize URLs by removing trailing slashes for comparison
-        def normalize_url(url):
-            return url.rstrip('/') if url else url
-
-        normalized_object_id = normalize_url(object_id)
-        normalized_api_url = normalize_url(inbox_owner.get_api_url(request))
-        normalized_inbox_url = normalize_url(
-            inbox_owner.url) if inbox_owner.url else None
-
-        if (
-            normalized_object_id != normalized_api_url and
-            (not normalized_inbox_url or
-             normalized_object_id != normalized_inbox_url)
-        ):
+        # Trailing slashes are ignored in the comparison
+        owner_urls = {inbox_owner.get_api_url(request).rstrip('/')}
+        if inbox_owner.url:
+            owner_urls.add(inbox_owner.url.rstrip('/'))
+
+        if not object_id or object_id.rstrip('/') not in owner_urls:
             return Response(
                 {
                     "detail": (
@@ -1609,51 +1796,30 @@ class InboxView(APIView):
                 return Response({"detail": str(e)},
                                 status=status.HTTP_400_BAD_REQUEST)
 
-        # Handle existing follow requests
-        try:
-            existing_follow = Follow.objects.get(
-                follower=actor, following=inbox_owner)
-            # If request exists and is pending, return existing request
-            # (idempotent)
-            if existing_follow.status == Follow.Status.PENDING:
-                serializer = FollowSerializer(
-                    existing_follow, context={'request': request})
-                return Response(
-                    serializer.data,
-                    status=status.HTTP_200_OK
-                )
-            # If already accepted, return success (idempotent)
-            elif existing_follow.status == Follow.Status.ACCEPTED:
-                serializer = FollowSerializer(
-                    existing_follow, context={'request': request})
-                return Response(
-                    serializer.data,
-                    status=status.HTTP_200_OK
-                )
-            # If it was rejected, we allow a new request by updating the
-            # status.
-            else:
-                existing_follow.status = Follow.Status.PENDING
-                existing_follow.save()
-                serializer = FollowSerializer(
-                    existing_follow, context={
-                        'request': request})
-                return Response(
-                    serializer.data,
-                    status=status.HTTP_201_CREATED)
-        except Follow.DoesNotExist:
-            pass  # No existing request, so we can proceed to create one.
-
-        # Create the follow request.
+        # Look up and create in one step; (follower, following) is unique,
+        # so concurrent deliveries of the same request cannot both insert
         try:
-            follow = Follow.objects.create(
+            follow, created = Follow.objects.get_or_create(
                 follower=actor,
-                following=inbox_owner
-            )
+                following=inbox_owner,
+                defaults={'status': Follow.Status.PENDING})
         except ValidationError as e:
             return Response(
                 {"detail": e.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
 
+        if not created:
+            # Pending and accepted requests are returned as they are
+            # (idempotent)
+            if follow.status in (Follow.Status.PENDING,
+                                 Follow.Status.ACCEPTED):
+                serializer = FollowSerializer(
+                    follow, context={'request': request})
+                return Response(serializer.data, status=status.HTTP_200_OK)
+            # If it was rejected, we allow a new request by updating the
+            # status.
+            follow.status = Follow.Status.PENDING
+            follow.save(update_fields=['status', 'updated_at'])
+
         serializer = FollowSerializer(follow, context={'request': request})
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -1695,7 +1861,7 @@ class InboxView(APIView):
         entry_to_check = liked_object if isinstance(
             liked_object, Entry) else liked_object.entry
 
-        if not self._user_can_view_entry(actor, entry_to_check):
+        if not self._user_can_view_entry(request, actor, entry_to_check):
             return Response(
                 {
                     "detail": "You don't have permission to like content."},
@@ -1758,7 +1924,7 @@ class InboxView(APIView):
             return Response({"detail": "Entry not found."},
                             status=status.HTTP_404_NOT_FOUND)
 
-        if not self._user_can_view_entry(actor, entry):
+        if not self._user_can_view_entry(request, actor, entry):
             return Response(
                 {
                     "detail": "don't have permission to comment on this."},
@@ -1767,19 +1933,22 @@ class InboxView(APIView):
         comment_url = data.get('id') or data.get('url')
 
         if comment_url:
-            if Comment.objects.filter(url=comment_url).exists():
+            # The url is the primary key, so a redelivered comment is
+            # matched by the lookup and a concurrent one cannot insert twice
+            comment, created = Comment.objects.get_or_create(
+                url=comment_url,
+                defaults={
+                    'author': actor,
+                    'entry': entry,
+                    'comment': data.get('comment'),
+                    'content_type': data.get('contentType', 'text/plain'),
+                    'published': data.get('published', timezone.now()),
+                }
+            )
+            if not created:
                 return Response(
                     {"detail": "Comment has already been received."},
                     status=200)
-
-            comment = Comment.objects.create(
-                url=comment_url,
-                author=actor,
-                entry=entry,
-                comment=data.get('comment'),
-                content_type=data.get('contentType', 'text/plain'),
-                published=data.get('published', timezone.now())
-            )
         else:
             comment = Comment.objects.create(
                 author=actor,
@@ -1840,7 +2009,7 @@ class InboxView(APIView):
     ],
     tags=['Comments & Likes (Author-Centric)']
 )
-class AuthorCommentedListView(generics.ListAPIView):
+class AuthorCommentedListView(ActivityCountCacheMixin, generics.ListAPIView):
     """
     GET /api/authors/{AUTHOR_SERIAL}/commented/ [local, remote]
     GET /api/authors/{AUTHOR_FQID}/commented/ [local]
@@ -1848,7 +2017,7 @@ class AuthorCommentedListView(generics.ListAPIView):
     """
     serializer_class = CommentSerializer
     permission_classes = [IsAuthenticatedOrReadOnlyForPublic]
-    pagination_class = StandardPagination
+    count_cache_kind = 'commented'
 
     def get_queryset(self):
         """
@@ -1867,24 +2036,26 @@ class AuthorCommentedListView(generics.ListAPIView):
             return Comment.objects.none()
 
         # Get all comments by this author
-        queryset = Comment.objects.filter(author=author).select_related(
-            'entry', 'entry__author'
-        ).order_by('-published')
+        queryset = Comment.objects.filter(author=author)
 
         # Apply visibility filtering based on authentication
-        if self.request.user.is_authenticated:
-            # Local authenticated users can see ALL comments by the author
-            # This follows the spec: [local] any entry
-            return queryset
-        else:
+        # Local authenticated users can see ALL comments by the author
+        # This follows the spec: [local] any entry
+        if not self.request.user.is_authenticated:
             # Unauthenticated (remote) users only see comments made
             # on public/unlisted entries
             # This follows the spec: [remote] public and unlisted entries
-            return queryset.filter(
+            queryset = queryset.filter(
                 entry__visibility__in=['PUBLIC', 'UNLISTED'],
                 entry__is_deleted=False
             )
 
+        # Join in the comment's author as well as the entry's, since the
+        # serializer reads both for every row
+        return queryset.select_related(
+            'author', 'entry', 'entry__author'
+        ).order_by('-published')
+
     def list(self, request, *args, **kwargs):
         """Override to match the spec's 'comments' object format."""
         queryset = self.filter_queryset(self.get_queryset())
@@ -2027,18 +2198,12 @@ class CommentByFQIDView(generics.RetrieveAPIView):
         try:
             decoded_fqid = urllib.parse.unquote(comment_fqid)
 
-            # Parse the URL path
-            parsed_url = urllib.parse.urlparse(decoded_fqid)
-            path_parts = parsed_url.path.strip('/').split('/')
-
             # Expected path:
-            # api/authors/{author_serial}/commented/{comment_serial}
-            if len(path_parts) < 4 or path_parts[-2] != 'commented':
+            # .../authors/{author_serial}/commented/{comment_serial}
+            match = _COMMENT_FQID_RE.match(decoded_fqid)
+            if match is None:
                 raise ValueError("Invalid comment FQID path structure")
-
-            comment_serial = path_parts[-1]
-            # authors/{author_serial}/commented/{comment_serial}
-            author_serial = path_parts[-3]
+            author_serial, comment_serial = match.groups()
 
             # Find the comment by serial and author serial
             return get_object_or_404(
@@ -2050,6 +2215,41 @@ class CommentByFQIDView(generics.RetrieveAPIView):
             raise Http404("Comment not found or FQID is malformed")
 
 
+def _with_liked_objects(queryset):
+    """
+    Load each like's author and liked object in bulk, along with the
+    authors their FQIDs are built from and, for comments, the entry whose
+    visibility decides who may see the like.
+    """
+    return queryset.select_related('author').prefetch_related(
+        GenericPrefetch('content_object', [
+            Entry.objects.select_related('author'),
+            Comment.objects.select_related('author', 'entry'),
+        ]))
+
+
+def _visible_like_or_404(like, user):
+    """
+    Return `like` if `user` may see it, else raise Http404. Authenticated
+    local users can see any like; anyone else only likes on public or
+    unlisted entries (directly, or through a comment on one).
+    """
+    content_object = like.content_object
+    if isinstance(content_object, Entry):
+        entry_to_check = content_object
+    elif isinstance(content_object, Comment):
+        entry_to_check = content_object.entry
+    else:
+        raise Http404("Liked object is not an Entry or Comment.")
+
+    if user.is_authenticated:
+        return like
+    if (entry_to_check.visibility in ('PUBLIC', 'UNLISTED') and
+            not entry_to_check.is_deleted):
+        return like
+    raise Http404("Like not found or access denied")
+
+
 @extend_schema(
     summary="List Likes by Author",
     description=(
@@ -2091,7 +2291,7 @@ class CommentByFQIDView(generics.RetrieveAPIView):
     ],
     tags=['Comments & Likes (Author-Centric)']
 )
-class AuthorLikedListView(generics.ListAPIView):
+class AuthorLikedListView(ActivityCountCacheMixin, generics.ListAPIView):
     """
     GET /api/authors/{AUTHOR_SERIAL}/liked/ [local, remote]
     Lists items an author has liked.
@@ -2100,7 +2300,7 @@ class AuthorLikedListView(generics.ListAPIView):
     """
     serializer_class = LikeSerializer
     permission_classes = [IsAuthenticatedOrReadOnlyForPublic]
-    pagination_class = StandardPagination
+    count_cache_kind = 'liked'
 
     def get_queryset(self):
         """
@@ -2115,13 +2315,23 @@ class AuthorLikedListView(generics.ListAPIView):
             # endpoint. Return an empty set.
             return Like.objects.none()
 
-        queryset = Like.objects.filter(author=author).order_by('-published')
+        queryset = _with_liked_objects(
+            Like.objects.filter(author=author).order_by('-published'))
 
         # For unauthenticated users, only show likes on public content.
         if not self.request.user.is_authenticated:
+            # One EXISTS per liked model, instead of outer-joining both
+            # through the generic relations
+            content_types = ContentType.objects.get_for_models(
+                Entry, Comment)
+            public_entry = Entry.objects.filter(
+                url=OuterRef('object_id'), visibility='PUBLIC')
+            public_comment = Comment.objects.filter(
+                url=OuterRef('object_id'), entry__visibility='PUBLIC')
             queryset = queryset.filter(
-                Q(entry__visibility='PUBLIC') |
-                Q(comment__entry__visibility='PUBLIC')
+                Q(Exists(public_entry), content_type=content_types[Entry]) |
+                Q(Exists(public_comment),
+                  content_type=content_types[Comment])
             )
 
         return queryset
@@ -2187,30 +2397,11 @@ class AuthorLikedDetailView(generics.RetrieveAPIView):
         like_serial = self.kwargs['like_serial']
 
         like = get_object_or_404(
-            Like.objects.select_related('author').prefetch_related(
-                'content_object'),
+            _with_liked_objects(Like.objects),
             author=author,
             serial=like_serial)
 
-        # Check visibility on the liked object
-        content_object = like.content_object
-        if isinstance(content_object, Entry):
-            entry_to_check = content_object
-        elif isinstance(content_object, Comment):
-            entry_to_check = content_object.entry
-        else:
-            raise Http404("Liked object is not an Entry or Comment.")
-
-        if self.request.user.is_authenticated:
-            return like  # Authenticated local users can see any liked item
-        else:
-            # Unauthenticated users can only see likes on public/unlisted
-            # entries
-            if entry_to_check.visibility in [
-                    'PUBLIC', 'UNLISTED'] and not entry_to_check.is_deleted:
-                return like
-            else:
-                raise Http404("Like not found or access denied")
+        return _visible_like_or_404(like, self.request.user)
 
 
 @extend_schema(
@@ -2239,23 +2430,7 @@ class LikeByFQIDView(generics.RetrieveAPIView):
         """Parse like FQID and retrieve like with permission checks"""
         like = self._parse_like_fqid(self.kwargs['like_fqid'])
 
-        # Check visibility on the liked object
-        content_object = like.content_object
-        if isinstance(content_object, Entry):
-            entry_to_check = content_object
-        elif isinstance(content_object, Comment):
-            entry_to_check = content_object.entry
-        else:
-            raise Http404("Liked object is not an Entry or Comment.")
-
-        if self.request.user.is_authenticated:
-            return like
-        else:
-            if entry_to_check.visibility in [
-                    'PUBLIC', 'UNLISTED'] and not entry_to_check.is_deleted:
-                return like
-            else:
-                raise Http404("Like not found or access denied")
+        return _visible_like_or_404(like, self.request.user)
 
     def _parse_like_fqid(self, like_fqid):
         """
@@ -2265,18 +2440,13 @@ class LikeByFQIDView(generics.RetrieveAPIView):
         """
         try:
             decoded_fqid = urllib.parse.unquote(like_fqid)
-            parsed_url = urllib.parse.urlparse(decoded_fqid)
-            path_parts = parsed_url.path.strip('/').split('/')
-
-            if len(path_parts) < 4 or path_parts[-2] != 'liked':
+            match = _LIKE_FQID_RE.match(decoded_fqid)
+            if match is None:
                 raise ValueError("Invalid like FQID path structure")
-
-            like_serial = path_parts[-1]
-            author_serial = path_parts[-3]
+            author_serial, like_serial = match.groups()
 
             return get_object_or_404(
-                Like.objects.select_related('author').prefetch_related(
-                    'content_object'),
+                _with_liked_objects(Like.objects),
                 serial=like_serial,
                 author__serial=author_serial
             )
@@ -2432,9 +2602,14 @@ def fan_out_entry_to_followers(sender, instance, created, **kwargs):
         followers_qs = Follow.objects.filter(
             following=author, status=Follow.Status.ACCEPTED)
 
-    followers = followers_qs.select_related('follower')
-
-    if not followers.exists():
+    # Only the followers' FQIDs are needed, so no Author rows are built
+    recipient_urls = [
+        Author.build_api_url(host, serial)
+        for host, serial in followers_qs.values_list(
+            'follower__host', 'follower__serial')
+        if host != author.host
+    ]
+    if not recipient_urls:
         return
 
     author_data = {
@@ -2462,21 +2637,8 @@ def fan_out_entry_to_followers(sender, instance, created, **kwargs):
         "comments": f"{instance.url}/comments"
     }
 
-    node_service = NodeService()
-    for follow_obj in followers:
-        follower = follow_obj.follower
-
-        if follower.host == author.host:
-            continue
-
-        try:
-            response = node_service.send_to_inbox(
-                follower.get_api_url(), entry_data)
-            if response:
-                response.raise_for_status()
-        except requests.exceptions.RequestException:
-            # Silently fail if fan-out to a specific node fails
-            pass
+    # Failures to reach a specific node are logged and otherwise ignored
+    fan_out(recipient_urls, entry_data)
 
 
 @receiver(post_save, sender=Like)
@@ -2525,11 +2687,21 @@ def fan_out_like(sender, instance, created, **kwargs):
             status=Follow.Status.ACCEPTED
         )
 
-    followers = followers_qs.select_related('follower')
+    # Only the followers' FQIDs are needed, so no Author rows are built
+    followers = list(followers_qs.values_list(
+        'follower__host', 'follower__serial'))
 
-    if not followers.exists():
+    if not followers:
         return
 
+    # Remote followers/friends who can see the entry. Local followers
+    # (same host as entry author) are skipped, and so is the entry author,
+    # who is sent the like separately below.
+    follower_urls = [
+        Author.build_api_url(host, serial) for host, serial in followers
+        if host != entry_author.host and serial != entry_author.serial
+    ]
+
     like_author_data = {
         "type": "author",
         "id": like_author.get_api_url(),
@@ -2546,37 +2718,12 @@ def fan_out_like(sender, instance, created, **kwargs):
         "url": instance.url,
         "published": instance.published.isoformat()}
 
-    node_service = NodeService()
-    # First, send to the entry author (if on a different node)
+    # The entry author (if on a different node) and the followers
+    recipient_urls = follower_urls
     if entry_author.host != like_author.host:
-        try:
-            response = node_service.send_to_inbox(
-                entry_author.get_api_url(), like_payload)
-            if response:
-                response.raise_for_status()
-        except requests.exceptions.RequestException:
-            logging.warning(
-                f"Failed to send like to {entry_author.get_api_url()}")
-
-    # Then send to all remote followers/friends who can see the entry
-    for follow_obj in followers:
-        follower = follow_obj.follower
+        recipient_urls = [entry_author.get_api_url()] + follower_urls
 
-        # Skip local followers (same host as entry author)
-        if follower.host == entry_author.host:
-            continue
-
-        # Skip if this is the same as entry author (already sent above)
-        if follower.serial == entry_author.serial:
-            continue
-
-        try:
-            response = node_service.send_to_inbox(
-                follower.get_api_url(), like_payload)
-            if response:
-                response.raise_for_status()
-        except requests.exceptions.RequestException:
-            logging.warning(f"Failed to send like to {follower.get_api_url()}")
+    fan_out(recipient_urls, like_payload)
 
 
 @receiver(post_save, sender=Comment)
@@ -2591,8 +2738,11 @@ def fan_out_comment(sender, instance, created, **kwargs):
     comment_author = instance.author
     original_author = instance.entry.author
 
-    recipients = {original_author}
-    recipients.update(comment_author.get_followers())
+    # (host, serial) pairs, so the original author and the followers are
+    # deduplicated without building an Author per follower
+    recipients = {(original_author.host, original_author.serial)}
+    recipients.update(comment_author.get_followers().exclude(
+        host=comment_author.host).values_list('host', 'serial'))
 
     comment_author_data = {
         "type": "author",
@@ -2612,22 +2762,10 @@ def fan_out_comment(sender, instance, created, **kwargs):
         "url": instance.url,
         "entry": instance.entry.url}
 
-    node_service = NodeService()
-    for recipient in recipients:
-        if recipient.serial == comment_author.serial:
-            continue
-
-        if recipient.host == comment_author.host:
-            continue
-
-        try:
-            response = node_service.send_to_inbox(
-                recipient.get_api_url(), comment_payload)
-            if response:
-                response.raise_for_status()
-        except requests.exceptions.RequestException:
-            logging.warning(
-                f"Failed to send comment to {recipient.get_api_url()}")
+    fan_out([
+        Author.build_api_url(host, serial) for host, serial in recipients
+        if serial != comment_author.serial and host != comment_author.host
+    ], comment_payload)
 
 
 @receiver(post_save, sender=Author)
@@ -2646,10 +2784,14 @@ def fan_out_author_updates_to_remote_nodes(
     if not instance.host or '/api/' in current_host:
         return
 
-    # Get all followers from remote nodes
-    followers = instance.get_followers().exclude(host=current_host)
-
-    if not followers.exists():
+    # Remote followers' FQIDs, from one query that loads only the columns
+    # they are built from
+    recipient_urls = [
+        Author.build_api_url(host, serial)
+        for host, serial in instance.get_followers().exclude(
+            host=current_host).values_list('host', 'serial')
+    ]
+    if not recipient_urls:
         return
 
     # Prepare the updated author data
@@ -2664,15 +2806,14 @@ def fan_out_author_updates_to_remote_nodes(
     }
 
     # Send the updated author data to each remote follower's inbox
-    node_service = NodeService()
-    for follower in followers:
-        try:
-            response = node_service.send_to_inbox(
-                follower.get_api_url(), author_data)
-            if response:
-                response.raise_for_status()
-        except requests.exceptions.RequestException:
-            logging.warning(
-                f"Failed to notify follower {follower.get_api_url()} "
-                f"about author update for {instance.get_api_url()}"
-            )
+    fan_out(recipient_urls, author_data)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Like)
+@receiver(post_delete, sender=Like)
+def clear_activity_counts(sender, instance, **kwargs):
+    """Drop the cached comment/like totals of the activity's author."""
+    kind = 'commented' if sender is Comment else 'liked'
+    cache.delete_many(_activity_count_cache_keys(kind, instance.author_id))
@@ -1,10 +1,22 @@
 import os
 import django
+import pytest
 
 
 def pytest_configure():
     """Configure Django settings for pytest"""
     os.environ.setdefault(
         'DJANGO_SETTINGS_MODULE',
-        'socialdistribution.settings')
+        'socialdistribution.settings_test')
     django.setup()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """
+    Clear the cache after every test. Cached rows such as RemoteNode
+    lookups would otherwise outlive the test transaction they came from.
+    """
+    yield
+    from django.core.cache import cache
+    cache.clear()
@@ -1,10 +1,18 @@
+import hashlib
 import requests
 import json
 from datetime import datetime
+from django.core.cache import cache
+from django.db.models.signals import post_save
 from .models import Entry
 from authors.models import Author
+from authors.net import SESSION
 # gnerated by Genimi 2.5pro 2025-07-07
 
+# How long the ETag of an author's GitHub event feed is kept for
+# conditional requests
+GITHUB_ETAG_CACHE_SECONDS = 60 * 60 * 24
+
 
 def _format_push_event(event: dict) -> dict:
     """Formats a PushEvent into Entry fields."""
@@ -66,55 +74,105 @@ def process_github_events(author: Author):
 
     api_url = f"https://api.github.com/users/{username}/events/public"
 
+    # The feed is requested conditionally: an unchanged feed is answered
+    # with an empty 304, which GitHub does not count against the rate limit
+    etag_cache_key = (
+        'github_events_etag:' + hashlib.sha256(username.encode()).hexdigest())
+    etag = cache.get(etag_cache_key)
+    headers = {'If-None-Match': etag} if etag else {}
+
     try:
-        response = requests.get(api_url, timeout=5)
+        response = SESSION.get(api_url, headers=headers, timeout=5)
+        if response.status_code == 304:
+            return
         response.raise_for_status()
         events = response.json()
     except (requests.exceptions.RequestException, json.JSONDecodeError):
         # Fail silently if the API call doesn't work
         return
 
-    if not events:
-        return
+    if events:
+        _import_github_events(author, events)
 
+    # Only remembered once the feed has been imported, so a failed import
+    # is retried on the next poll instead of being answered with a 304
+    etag = response.headers.get('ETag')
+    if etag:
+        cache.set(etag_cache_key, etag, timeout=GITHUB_ETAG_CACHE_SECONDS)
+
+
+def _import_github_events(author: Author, events: list):
+    """
+    Create Entry objects for the supported events in `events` that have
+    not been imported yet.
+    """
     EVENT_HANDLERS = {
         'PushEvent': _format_push_event,
         'CreateEvent': _format_create_event,
         'WatchEvent': _format_watch_event,
     }
 
-    new_entries_created = 0
+    # Events already imported, looked up in one query. github_event_id is
+    # unique across all authors, so the check is not scoped to this one.
+    imported_ids = set(Entry.objects.filter(github_event_id__in=[
+        event['id'] for event in events
+        if event['type'] in EVENT_HANDLERS
+    ]).values_list('github_event_id', flat=True))
+
+    new_entries = []
     for event in reversed(events):
         event_id = event['id']
         event_type = event['type']
 
-        if Entry.objects.filter(github_event_id=event_id).exists():
+        if event_id in imported_ids:
             continue
 
         if event_type not in EVENT_HANDLERS:
             continue
 
         handler = EVENT_HANDLERS[event_type]
-        entry_data = handler(event)
 
         try:
+            entry_data = handler(event)
             published_time = datetime.fromisoformat(
                 event['created_at'].replace('Z', '+00:00'))
+        except (KeyError, IndexError, TypeError, ValueError):
+            # Skip events whose payload is not in the expected shape
+            continue
+
+        entry = Entry(
+            author=author,
+            github_event_id=event_id,
+            title=entry_data['title'],
+            description=entry_data['description'],
+            content=entry_data['content'],
+            content_type='text/markdown',
+            visibility='PUBLIC',
+            published=published_time,
+        )
+        # bulk_create() does not call save(), which normally fills this in
+        entry.url = entry.get_api_url()
+        new_entries.append(entry)
+
+    if not new_entries:
+        return
+
+    # One INSERT for the whole batch. An event imported concurrently by
+    # another request is skipped by the github_event_id unique constraint.
+    Entry.objects.bulk_create(new_entries, ignore_conflicts=True)
+    created_urls = set(Entry.objects.filter(
+        url__in=[entry.url for entry in new_entries]
+    ).values_list('url', flat=True))
 
-            Entry.objects.create(
-                author=author,
-                github_event_id=event_id,
-                title=entry_data['title'],
-                description=entry_data['description'],
-                content=entry_data['content'],
-                content_type='text/markdown',
-                visibility='PUBLIC',
-                published=published_time,
-            )
+    # bulk_create() sends no signals, so announce the inserted entries
+    # ourselves; this is what fans them out to remote followers
+    new_entries_created = 0
+    for entry in new_entries:
+        if entry.url in created_urls:
+            post_save.send(sender=Entry, instance=entry, created=True,
+                           update_fields=None, raw=False,
+                           using=Entry.objects.db)
             new_entries_created += 1
-        except Exception:
-            # If creating the entry fails for any reason, skip it
-            continue
 
     if new_entries_created > 0:
         print(
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-16 11:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entries', '0002_like_content_type_object_id_author_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['author', '-published'], name='entries_com_author__461e90_idx'),
+        ),
+    ]
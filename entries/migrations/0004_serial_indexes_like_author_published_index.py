@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-16 12:20
+
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('entries', '0003_comment_author_published_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='comment',
+            name='serial',
+            field=models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='entry',
+            name='serial',
+            field=models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+        ),
+        migrations.AlterField(
+            model_name='like',
+            name='serial',
+            field=models.UUIDField(db_index=True, default=uuid.uuid4, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='like',
+            index=models.Index(fields=['author', '-published'], name='entries_lik_author__24953b_idx'),
+        ),
+    ]
@@ -36,7 +36,7 @@ class Entry(models.Model):
     )
     # Local identifier for URL construction
     serial: models.UUIDField = models.UUIDField(
-        default=uuid.uuid4, editable=False)
+        default=uuid.uuid4, editable=False, db_index=True)
 
     # Identification
     github_event_id: models.CharField = models.CharField(
@@ -99,7 +99,7 @@ class Comment(models.Model):
     )
     # Local identifier for URL construction
     serial: models.UUIDField = models.UUIDField(
-        default=uuid.uuid4, editable=False)
+        default=uuid.uuid4, editable=False, db_index=True)
 
     # Relationships
     author: models.ForeignKey = models.ForeignKey(
@@ -117,6 +117,12 @@ class Comment(models.Model):
 
     likes = GenericRelation('Like', related_query_name='comment')
 
+    class Meta:
+        indexes = [
+            # An author's comments, newest first
+            models.Index(fields=['author', '-published']),
+        ]
+
     def save(self, *args, **kwargs):
         """Automatically generate the URL field if not set."""
         if not self.url:
@@ -140,7 +146,7 @@ class Like(models.Model):
     )
     # Local identifier for URL construction
     serial: models.UUIDField = models.UUIDField(
-        default=uuid.uuid4, editable=False)
+        default=uuid.uuid4, editable=False, db_index=True)
 
     # Relationships
     author: models.ForeignKey = models.ForeignKey(
@@ -156,6 +162,15 @@ class Like(models.Model):
     # Metadata
     published: models.DateTimeField = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Covers listing an object's likes and the "has this author
+            # already liked it" lookup
+            models.Index(fields=['content_type', 'object_id', 'author']),
+            # An author's likes, newest first
+            models.Index(fields=['author', '-published']),
+        ]
+
     def save(self, *args, **kwargs):
         """Automatically generate the URL field if not set."""
         if not self.url:
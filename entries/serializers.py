@@ -109,7 +109,7 @@ class CommentSerializer(serializers.ModelSerializer):
         content_type = ContentType.objects.get_for_model(obj)
         likes_queryset = Like.objects.filter(
             content_type=content_type, object_id=obj.url
-        ).order_by('-published')
+        ).select_related('author').order_by('-published')
 
         count = likes_queryset.count()
         first_5_likes = likes_queryset[:5]
@@ -205,7 +205,9 @@ class EntrySerializer(serializers.ModelSerializer):
         """
         Return a paginated-like summary of the first 5 comments for the entry.
         """
-        comments_queryset = obj.comments.all().order_by('-published')
+        # Each comment reads its author and its entry's author
+        comments_queryset = obj.comments.select_related(
+            'author', 'entry__author').order_by('-published')
         count = comments_queryset.count()
         first_5_comments = comments_queryset[:5]
         comment_serializer = CommentSerializer(
@@ -229,7 +231,7 @@ class EntrySerializer(serializers.ModelSerializer):
         content_type = ContentType.objects.get_for_model(obj)
         likes_queryset = Like.objects.filter(
             content_type=content_type, object_id=obj.serial
-        ).order_by('-published')
+        ).select_related('author').order_by('-published')
 
         count = likes_queryset.count()
         first_5_likes = likes_queryset[:5]
@@ -247,6 +249,25 @@ class EntrySerializer(serializers.ModelSerializer):
         }
 
 
+class EntrySummarySerializer(serializers.ModelSerializer):
+    """
+    Minimal Entry representation used by the entry list endpoints when the
+    client requests `?lean=1`.
+    """
+    type = serializers.CharField(default='entry', read_only=True)
+    id = serializers.SerializerMethodField(
+        help_text="The FQID of the entry."
+    )
+
+    class Meta:
+        model = Entry
+        fields = ['type', 'id', 'visibility']
+
+    @extend_schema_field(serializers.URLField())
+    def get_id(self, obj):
+        return obj.get_api_url()
+
+
 class PaginatedCommentSerializer(serializers.Serializer):
     """Serializer for a paginated list of comments"""
     type = serializers.CharField(default='comments', read_only=True)
@@ -66,6 +66,24 @@ class TestEntryAPI:
         assert len(response.data['src']) == 1
         assert response.data['src'][0]['visibility'] == 'PUBLIC'
 
+    def test_list_public_entries_lean(
+            self, api_client, author_a, django_assert_num_queries):
+        """`?lean=1` returns only type, id and visibility for each entry."""
+        entries = EntryFactory.create_batch(
+            3, author=author_a, visibility='PUBLIC')
+
+        # One COUNT for pagination and one SELECT for the page.
+        with django_assert_num_queries(2):
+            response = api_client.get('/api/entries/?lean=1')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 3
+        for entry in response.data['src']:
+            assert set(entry) == {'type', 'id', 'visibility'}
+        returned_serials = {
+            entry['id'].split('/')[-1] for entry in response.data['src']}
+        assert returned_serials == {str(entry.serial) for entry in entries}
+
     def test_update_other_author_entry_forbidden(
             self, api_client, author_a, author_b):
         """Author B cannot update Author A's entry."""
@@ -10,7 +10,8 @@ from drf_spectacular.utils import (
 from .models import Author, Entry, Comment, Like
 from .serializers import (
     EntrySerializer, CommentSerializer, LikeSerializer, EntryListSerializer,
-    CommentListResponseSerializer, LikeListResponseSerializer
+    CommentListResponseSerializer, LikeListResponseSerializer,
+    EntrySummarySerializer
 )
 from .permissions import (
     EntryPermission,
@@ -27,6 +28,41 @@ from authors.views import StandardPagination
 import uuid
 
 
+LEAN_PARAMETER = OpenApiParameter(
+    name='lean',
+    type=int,
+    location=OpenApiParameter.QUERY,
+    description=(
+        'Set to 1 to return only the type, id and visibility of each entry.'
+    )
+)
+
+
+class LeanEntryListMixin:
+    """
+    Lets an entry list endpoint return EntrySummarySerializer objects when
+    the request includes `?lean=1`. Only the columns needed to build the
+    entry FQID are loaded in that case.
+    """
+
+    def is_lean(self):
+        return self.request.query_params.get('lean') == '1'
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET' and self.is_lean():
+            return EntrySummarySerializer
+        return super().get_serializer_class()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.is_lean():
+            queryset = queryset.select_related('author').only(
+                'url', 'serial', 'visibility', 'published',
+                'author', 'author__host', 'author__serial'
+            )
+        return queryset
+
+
 @extend_schema(
     summary="Retrieve the User's Stream",
     description=(
@@ -179,10 +215,11 @@ The stream combines multiple sources based on the user's relationships:
             location=OpenApiParameter.QUERY,
             description='Number of results to return per page.'
         ),
+        LEAN_PARAMETER,
     ],
     tags=['Stream']
 )
-class StreamView(generics.ListAPIView):
+class StreamView(LeanEntryListMixin, generics.ListAPIView):
     """
     GET: List all entries for the current user's stream.
     """
@@ -411,10 +448,11 @@ activity across the entire server.
             location=OpenApiParameter.QUERY,
             description='Number of results to return per page.'
         ),
+        LEAN_PARAMETER,
     ],
     tags=['Entries']
 )
-class PublicEntryListView(generics.ListAPIView):
+class PublicEntryListView(LeanEntryListMixin, generics.ListAPIView):
     """
     GET: List all public entries known to the node.
     """
@@ -619,10 +657,11 @@ This endpoint handles two main operations for an author's entries:
                 'Only for GET requests.'
             )
         ),
+        LEAN_PARAMETER,
     ],
     tags=['Entries']
 )
-class EntryListView(generics.ListCreateAPIView):
+class EntryListView(LeanEntryListMixin, generics.ListCreateAPIView):
     """
     GET: List entries for a given author, filtered by visibility.
     POST: Create a new entry for the currently authenticated author.
@@ -634,7 +673,10 @@ class EntryListView(generics.ListCreateAPIView):
     def get_queryset(self):
         # This method remains the same
         author_serial = self.kwargs['author_serial']
-        author = get_object_or_404(Author, serial=author_serial)
+        # Only compared by pk and used as the key of the follow and entry
+        # relations, which are keyed on the url
+        author = get_object_or_404(
+            Author.objects.only('id', 'url'), serial=author_serial)
         queryset = Entry.objects.filter(author=author, is_deleted=False)
         if self.request.user.is_authenticated and self.request.user == author:
             return queryset.order_by('-published')
@@ -38,6 +38,22 @@ ALLOWED_HOSTS = ["*"]
 # When False, new users will be created with `is_active=True` (default)
 SIGNUP_REQUIRES_APPROVAL = False
 
+# Minimum number of seconds between two syncs of the remote author lists
+# triggered by GET /api/authors/. Within this window the listing is served
+# from the proxy authors already stored locally.
+REMOTE_AUTHORS_SYNC_INTERVAL = 300
+# When True, that sync runs on a background thread and the listing returns
+# immediately. Nodes can also be synced on a schedule with
+# `python manage.py sync_remote_authors`.
+REMOTE_AUTHORS_SYNC_IN_BACKGROUND = True
+# When True, the inbox deliveries fanned out after an entry, comment, like
+# or author profile is saved are sent on a background thread once the save
+# commits, so the request that saved it does not wait on remote nodes.
+# The thread is a plain daemon thread, not a queue: deliveries still in
+# flight when the worker process is recycled or shut down are dropped
+# without being retried or logged. Set to False to send them inline.
+FANOUT_IN_BACKGROUND = True
+
 INSTALLED_APPS = [
     # Django
     'django.contrib.admin',
@@ -119,8 +135,11 @@ if 'DATABASE_URL' in os.environ:
             'DATABASE_URL', ''))
 
     DATABASES = {
+        # Connections are kept open between requests; a health check on
+        # reuse replaces ones the server has dropped.
         "default": dj_database_url.config(
             conn_max_age=600,
+            conn_health_checks=True,
             ssl_require=ssl_require,
         )
     }
@@ -187,6 +206,30 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'authors.Author'
 
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+# App loggers write to the console. Set LOG_LEVEL=DEBUG to see federation
+# debug messages; below that level they are never formatted.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'authors': {
+            'handlers': ['console'],
+            'level': os.environ.get('LOG_LEVEL', 'INFO'),
+        },
+        'entries': {
+            'handlers': ['console'],
+            'level': os.environ.get('LOG_LEVEL', 'INFO'),
+        },
+    },
+}
+
 # Multi-node cookie configuration to prevent conflicts
 # This allows running multiple Django instances on different ports
 # without session/CSRF cookie conflicts
@@ -0,0 +1,27 @@
+"""
+Django settings used by the test suite.
+
+Extends the default settings and limits Django REST Framework to JSON.
+The tests only ever send and parse JSON, so the browsable API renderer
+and the form/multipart parsers are never needed.
+
+Remote author syncs and inbox fan-out run inline, so they stay inside the
+test transaction.
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import REST_FRAMEWORK as BASE_REST_FRAMEWORK
+
+REST_FRAMEWORK = {
+    **BASE_REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'rest_framework.parsers.JSONParser',
+    ],
+    'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+}
+
+REMOTE_AUTHORS_SYNC_IN_BACKGROUND = False
+FANOUT_IN_BACKGROUND = False